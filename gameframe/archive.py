@@ -0,0 +1,219 @@
+"""This module defines the columnar archives of finished games in GameFrame, which require NumPy.
+
+An archive is a directory of tables, one per game type, each of which is a directory of columns stored as ``.npy``
+files. The columns are fixed-width arrays with one row per game, so they can be opened as memory maps and aggregated
+without creating any game objects. The tables are as follows:
+
+- tictactoe: The 'moves' column holds the cell indices 3 * r + c of the marks in order, padded with -1. The
+  'move_counts' and 'winners' columns hold the number of marks and the index of the winner (-1 if there is none).
+- rockpaperscissors<player count>: The 'hands' column holds the hand indices of the players (-1 if no hand was thrown).
+  The 'winning_hands' column holds the index of the winning hand (-1 if there is none).
+
+Columns are written in chunks, so archives of any size can be written with constant memory. The headers of the columns
+are written by NumPy, and are rewritten with the row counts when the writers are closed.
+"""
+from io import BytesIO
+from os import listdir, makedirs
+from os.path import exists, isdir, join
+
+import numpy as np
+
+from gameframe.games.rockpaperscissors import RockPaperScissorsGame
+from gameframe.games.tictactoe import TicTacToeGame
+
+class ArchiveWriter:
+    """ArchiveWriter is the class for writers of game archives.
+
+    The games are appended to the tables of their types, which are created if they do not exist, so an archive can be
+    written over many sessions by writers opened one after another. Writers can be used as context managers. The
+    archive can only be read after the writer is closed.
+
+    :param path: The path of the directory of the archive. It is created if it does not exist.
+    :param chunk_size: The number of rows buffered per column before they are written.
+    """
+
+    def __init__(self, path, chunk_size=65536):
+        self._path = path
+        self._chunk_size = chunk_size
+        self._tables = {}
+
+        makedirs(path, exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, *games):
+        """Appends the games to the archive.
+
+        :param games: The tic tac toe or rock paper scissors games to write.
+        :return: This writer.
+        """
+        for game in games:
+            if isinstance(game, TicTacToeGame):
+                moves = [-1] * 9
+
+                for i, action in enumerate(game._actions):
+                    moves[i] = 3 * action.r + action.c
+
+                self._get_table('tictactoe', {
+                    'moves': (np.int8, (9,)),
+                    'move_counts': (np.uint8, ()),
+                    'winners': (np.int8, ()),
+                }).append(moves, len(game._actions), -1 if game.winner is None else game.winner.index)
+            elif isinstance(game, RockPaperScissorsGame):
+                player_count = len(game.players)
+                winning_hand = game.winning_hand
+
+                self._get_table(f'rockpaperscissors{player_count}', {
+                    'hands': (np.int8, (player_count,)),
+                    'winning_hands': (np.int8, ()),
+                }).append(
+                    [-1 if player.hand is None else player.hand.index for player in game.players],
+                    -1 if winning_hand is None else winning_hand.index,
+                )
+            else:
+                raise TypeError('Only tic tac toe and rock paper scissors games can be archived')
+
+        return self
+
+    def close(self):
+        """Writes the buffered rows and finalizes the columns of the archive.
+
+        :return: None.
+        """
+        for table in self._tables.values():
+            table.close()
+
+        self._tables.clear()
+
+    def _get_table(self, name, columns):
+        table = self._tables.get(name)
+
+        if table is None:
+            table = self._tables[name] = _TableWriter(join(self._path, name), columns, self._chunk_size)
+
+        return table
+
+
+def load_archive(path):
+    """Opens the tables of the archive as memory maps.
+
+    :param path: The path of the directory of the archive.
+    :return: A dictionary of the tables, which are dictionaries of the read-only column arrays keyed by the column
+             names, keyed by the table names.
+    """
+    return {
+        table_name: {
+            file_name[:-len('.npy')]: np.load(join(path, table_name, file_name), mmap_mode='r')
+            for file_name in sorted(listdir(join(path, table_name))) if file_name.endswith('.npy')
+        } for table_name in sorted(listdir(path)) if isdir(join(path, table_name))
+    }
+
+
+class _TableWriter:
+    def __init__(self, path, columns, chunk_size):
+        makedirs(path, exist_ok=True)
+
+        self._columns = []
+
+        try:
+            for name, (dtype, shape) in columns.items():
+                self._columns.append(_ColumnWriter(join(path, f'{name}.npy'), dtype, shape, chunk_size))
+
+            if len({column._count for column in self._columns}) != 1:
+                raise ValueError(f'The columns of the table {path!r} have different row counts')
+        except BaseException:
+            for column in self._columns:
+                column._file.close()
+
+            raise
+
+    def append(self, *values):
+        for column, value in zip(self._columns, values):
+            column.append(value)
+
+    def close(self):
+        for column in self._columns:
+            column.close()
+
+
+class _ColumnWriter:
+    def __init__(self, path, dtype, shape, chunk_size):
+        self._dtype = np.dtype(dtype)
+        self._shape = shape
+        self._buffer = np.empty((chunk_size, *shape), dtype=dtype)
+        self._buffered_count = 0
+
+        if exists(path):
+            self._file = open(path, 'r+b')
+
+            try:
+                self._count = self._read_header(path)
+            except BaseException:
+                self._file.close()
+
+                raise
+
+            self._header_length = self._file.tell()
+            self._file.seek(self._header_length + self._count * self._buffer[:1].nbytes)
+            self._file.truncate()
+        else:
+            self._file = open(path, 'w+b')
+            self._count = 0
+
+            self._file.write(self._get_header(0))
+            self._header_length = self._file.tell()
+
+    def append(self, value):
+        self._buffer[self._buffered_count] = value
+        self._buffered_count += 1
+
+        if self._buffered_count == len(self._buffer):
+            self._flush()
+
+    def close(self):
+        self._flush()
+
+        header = self._get_header(self._count)
+
+        if len(header) != self._header_length:
+            self._file.seek(self._header_length)
+            header += self._file.read()
+            self._file.truncate(len(header))
+
+        self._file.seek(0)
+        self._file.write(header)
+        self._file.close()
+
+    def _flush(self):
+        self._file.write(self._buffer[:self._buffered_count].tobytes())
+        self._count += self._buffered_count
+        self._buffered_count = 0
+
+    def _get_header(self, count):
+        file = BytesIO()
+        np.lib.format.write_array_header_1_0(file, {
+            'descr': np.lib.format.dtype_to_descr(self._dtype),
+            'fortran_order': False,
+            'shape': (count, *self._shape),
+        })
+
+        return file.getvalue()
+
+    def _read_header(self, path):
+        version = np.lib.format.read_magic(self._file)
+
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(self._file)
+        elif version == (2, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(self._file)
+        else:
+            raise ValueError(f'The column {path!r} has an unsupported format version {version}')
+
+        if fortran_order or dtype != self._dtype or len(shape) != 1 + len(self._shape) or shape[1:] != self._shape:
+            raise ValueError(f'The column {path!r} does not match the {self._dtype} column of shape {self._shape}')
+
+        return shape[0]
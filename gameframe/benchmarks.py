@@ -0,0 +1,272 @@
+"""This module defines the benchmark suite of GameFrame.
+
+Each benchmark times a single hot operation (or a full random game) and reports the number of operations per second.
+The results can be saved as JSON and compared against a stored baseline to detect regressions.
+
+The suite can be run from the terminal:
+
+.. code-block:: console
+
+   python -m gameframe.benchmarks --output results.json --baseline baseline.json
+"""
+import json
+import platform
+import sys
+from argparse import ArgumentParser
+from collections import deque
+from itertools import repeat
+from time import perf_counter
+
+from gameframe.games.rockpaperscissors import RockPaperScissorsGame, RockPaperScissorsHand
+from gameframe.games.tictactoe import TicTacToeGame, _MarkAction
+from gameframe.rollout import rollout
+
+
+def _consume(iterator):
+    deque(iterator, maxlen=0)
+
+
+def _create_tic_tac_toe_game():
+    return TicTacToeGame().mark((1, 1), (0, 0), (2, 2))
+
+
+def _create_rock_paper_scissors_game():
+    return RockPaperScissorsGame(5).throw(*map(RockPaperScissorsHand, ('Rock', 'Paper', 'Rock', 'Rock', 'Paper')))
+
+
+def _bench_game_players(count):
+    game = _create_tic_tac_toe_game()
+
+    return lambda: _consume(game.players for _ in repeat(None, count))
+
+
+def _bench_actor_index(count):
+    player = _create_tic_tac_toe_game().players[1]
+
+    return lambda: _consume(player.index for _ in repeat(None, count))
+
+
+def _bench_actor_next(count):
+    player = _create_tic_tac_toe_game().players[1]
+
+    return lambda: _consume(map(next, repeat(player, count)))
+
+
+def _bench_sequential_actor_is_actor(count):
+    player = _create_tic_tac_toe_game().players[1]
+
+    return lambda: _consume(player.is_actor() for _ in repeat(None, count))
+
+
+def _bench_tic_tac_toe_winner(count):
+    game = _create_tic_tac_toe_game()
+
+    return lambda: _consume(game.winner for _ in repeat(None, count))
+
+
+def _bench_tic_tac_toe_board(count):
+    games = [_create_tic_tac_toe_game() for _ in range(count)]
+
+    return lambda: _consume(game.board for game in games)
+
+
+def _bench_tic_tac_toe_board_view(count):
+    games = [_create_tic_tac_toe_game() for _ in range(count)]
+
+    return lambda: _consume(game.board_view for game in games)
+
+
+def _bench_tic_tac_toe_empty_cell_locations(count):
+    game = _create_tic_tac_toe_game()
+
+    return lambda: _consume(tuple(game.empty_cell_locations) for _ in repeat(None, count))
+
+
+def _bench_mark_action_act(count):
+    games = [_create_tic_tac_toe_game() for _ in range(count)]
+
+    return lambda: _consume(_MarkAction(0, 2, game.actor).act() for game in games)
+
+
+def _bench_unchecked_mark_action_act(count):
+    games = [_create_tic_tac_toe_game() for _ in range(count)]
+
+    return lambda: _consume(_MarkAction(0, 2, game.actor).act(False) for game in games)
+
+
+def _bench_rock_paper_scissors_winners(count):
+    game = _create_rock_paper_scissors_game()
+
+    return lambda: _consume(tuple(game.winners) for _ in repeat(None, count))
+
+
+def _bench_rock_paper_scissors_is_terminal(count):
+    game = _create_rock_paper_scissors_game()
+
+    return lambda: _consume(game.is_terminal() for _ in repeat(None, count))
+
+
+def _play_tic_tac_toe_game():
+    game = TicTacToeGame()
+
+    while not game.is_terminal():
+        game.actor.mark()
+
+
+def _play_rock_paper_scissors_game():
+    for player in RockPaperScissorsGame(5).players:
+        player.throw()
+
+
+def _bench_tic_tac_toe_game(count):
+    return lambda: _consume(_play_tic_tac_toe_game() for _ in repeat(None, count))
+
+
+def _bench_rock_paper_scissors_game(count):
+    return lambda: _consume(_play_rock_paper_scissors_game() for _ in repeat(None, count))
+
+
+def _bench_tic_tac_toe_rollout(count):
+    return lambda: _consume(rollout(TicTacToeGame()) for _ in repeat(None, count))
+
+
+def _bench_rock_paper_scissors_rollout(count):
+    return lambda: _consume(rollout(RockPaperScissorsGame(5)) for _ in repeat(None, count))
+
+
+BENCHMARKS = {
+    'Game.players': _bench_game_players,
+    'Actor.index': _bench_actor_index,
+    'Actor.__next__': _bench_actor_next,
+    'SequentialActor.is_actor': _bench_sequential_actor_is_actor,
+    'TicTacToeGame.winner': _bench_tic_tac_toe_winner,
+    'TicTacToeGame.board': _bench_tic_tac_toe_board,
+    'TicTacToeGame.board_view': _bench_tic_tac_toe_board_view,
+    'TicTacToeGame.empty_cell_locations': _bench_tic_tac_toe_empty_cell_locations,
+    '_MarkAction.act': _bench_mark_action_act,
+    '_MarkAction.act (unchecked)': _bench_unchecked_mark_action_act,
+    'RockPaperScissorsGame.winners': _bench_rock_paper_scissors_winners,
+    'RockPaperScissorsGame.is_terminal': _bench_rock_paper_scissors_is_terminal,
+    'TicTacToeGame (random game)': _bench_tic_tac_toe_game,
+    'RockPaperScissorsGame (random game)': _bench_rock_paper_scissors_game,
+    'TicTacToeGame (rollout)': _bench_tic_tac_toe_rollout,
+    'RockPaperScissorsGame (rollout)': _bench_rock_paper_scissors_rollout,
+}
+"""The benchmarks of GameFrame.
+
+Each benchmark is a callable that accepts an operation count, prepares the operations, and returns a callable that
+performs them.
+"""
+
+
+def measure(benchmark, duration=0.2, repeat_count=3):
+    """Measures the speed of the benchmark.
+
+    The operation count is doubled until a single run takes at least the given duration, and the fastest of the
+    repeated runs is reported.
+
+    :param benchmark: The benchmark to measure.
+    :param duration: The minimum number of seconds a run should take.
+    :param repeat_count: The number of repeated runs.
+    :return: The number of operations per second.
+    """
+    count = 1
+
+    while True:
+        times = []
+
+        for _ in range(repeat_count):
+            function = benchmark(count)
+            init_time = perf_counter()
+            function()
+            times.append(perf_counter() - init_time)
+
+        if min(times) >= duration:
+            return count / min(times)
+
+        count *= 2
+
+
+def run_benchmarks(names=None, duration=0.2, repeat_count=3):
+    """Runs the benchmarks.
+
+    :param names: The optional names of the benchmarks to run. If it is None, all benchmarks are run.
+    :param duration: The minimum number of seconds a run should take.
+    :param repeat_count: The number of repeated runs.
+    :return: The JSON-serializable results of the benchmarks.
+    """
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'results': {
+            name: measure(BENCHMARKS[name], duration, repeat_count) for name in (BENCHMARKS if names is None else names)
+        },
+    }
+
+
+def compare(results, baseline, tolerance=0.1):
+    """Compares the results against the baseline.
+
+    :param results: The results of the benchmarks.
+    :param baseline: The baseline results of the benchmarks.
+    :param tolerance: The tolerated relative slowdown.
+    :return: A dictionary of the names of the regressed benchmarks and their speed ratios to the baseline.
+    """
+    regressions = {}
+
+    for name, speed in results['results'].items():
+        if name in baseline['results']:
+            ratio = speed / baseline['results'][name]
+
+            if ratio < 1 - tolerance:
+                regressions[name] = ratio
+
+    return regressions
+
+
+def main(args=None):
+    """Runs the benchmark suite from the terminal.
+
+    :param args: The optional command line arguments.
+    :return: 1 if any benchmark regressed against the baseline, else 0.
+    """
+    parser = ArgumentParser(description='Run the GameFrame benchmarks.')
+    parser.add_argument('names', nargs='*', help='the names of the benchmarks to run (all if omitted)')
+    parser.add_argument('--duration', type=float, default=0.2, help='the minimum number of seconds per run')
+    parser.add_argument('--repeat', type=int, default=3, help='the number of runs per benchmark')
+    parser.add_argument('--output', help='the path of the JSON file to write the results to')
+    parser.add_argument('--baseline', help='the path of the JSON file of the baseline results')
+    parser.add_argument('--tolerance', type=float, default=0.1, help='the tolerated relative slowdown')
+    args = parser.parse_args(args)
+
+    results = run_benchmarks(args.names or None, args.duration, args.repeat)
+    baseline = None
+
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+    for name, speed in results['results'].items():
+        if baseline is None or name not in baseline['results']:
+            print(f'{name:<40} {speed:>16,.0f} ops/s')
+        else:
+            print(f'{name:<40} {speed:>16,.0f} ops/s {speed / baseline["results"][name]:>8.2f}x')
+
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+
+        for name, ratio in regressions.items():
+            print(f'Regression: {name} runs at {ratio:.2f}x of the baseline speed')
+
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
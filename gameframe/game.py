@@ -8,8 +8,10 @@ These components are as follows:
 
 All elements of games in GameFrame should inherit from the above classes.
 """
+import random
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
+from copy import copy
 
 from gameframe.exceptions import GameFrameError
 
@@ -19,13 +21,29 @@ class Game(ABC):
 
     Every game has to define its nature and players.
 
+    Random actions of a game are drawn from its random number generator. If it is not supplied, the random module is
+    used, so seeding the random module seeds the game. Otherwise, the generator (or the seed) is wrapped in a
+    :class:`RandomBuffer` unless it already is one. Buffers can be shared among many games, and clones share the
+    generator of the original game.
+
+    Actions are verified before they are applied unless the game or the call that applies them is unchecked. Unchecked
+    actions must come from a trusted source, such as the legal moves of the game, as illegal actions leave the game in
+    an undefined state.
+
     :param nature: The nature of this game.
     :param players: The players of this game.
+    :param rng: The optional seed or random number generator of this game.
     """
 
-    def __init__(self, nature, players):
+    __slots__ = '_nature', '_players', '_random', '_checked'
+
+    def __init__(self, nature, players, rng=None):
         self._nature = nature
-        self._players = list(players)
+        self._players = tuple(players)
+        self._random = _GLOBAL_RANDOM if rng is None else rng if isinstance(rng, RandomBuffer) else RandomBuffer(rng)
+        self._checked = True
+
+        self._link_actors()
 
     @property
     def nature(self):
@@ -41,7 +59,44 @@ class Game(ABC):
 
         :return: The players of this game.
         """
-        return tuple(self._players)
+        return self._players
+
+    @property
+    def checked(self):
+        """Returns whether or not if the actions applied to this game are verified.
+
+        :return: True if the actions applied to this game are verified, else False.
+        """
+        return self._checked
+
+    @checked.setter
+    def checked(self, checked):
+        self._checked = checked
+
+    def clone(self):
+        """Returns a clone of this game.
+
+        Unlike deep copies, clones only copy the actors and the mutable state of the game. The actors of the clone are
+        bound to the clone.
+
+        :return: The clone of this game.
+        """
+        game = copy(self)
+        game._nature = self._nature._clone(game)
+        game._players = tuple(player._clone(game) for player in self._players)
+
+        game._link_actors()
+
+        return game
+
+    def reset(self):
+        """Resets this game to its initial state in place.
+
+        The actors of this game are kept, so resetting a game is cheaper than creating a new one.
+
+        :return: This game.
+        """
+        return self
 
     @abstractmethod
     def is_terminal(self):
@@ -51,18 +106,33 @@ class Game(ABC):
         """
         ...
 
+    def _link_actors(self):
+        self._nature._index = None
+        self._nature._next = self._nature
+
+        for i, player in enumerate(self._players):
+            player._index = i
+            player._next = self._players[(i + 1) % len(self._players)]
+
 
 class Actor(Iterator):
     """Actor is the class for actors.
 
+    The index and the next actor of each actor are assigned when its game is created, so both are looked up in
+    constant time.
+
     :param game: The game of this actor.
     """
 
+    __slots__ = '_game', '_index', '_next'
+
     def __init__(self, game):
         self._game = game
+        self._index = None
+        self._next = None
 
     def __next__(self):
-        return self.game.nature if self.is_nature() else self.game.players[(self.index + 1) % len(self.game.players)]
+        return self._next
 
     @property
     def game(self):
@@ -80,29 +150,105 @@ class Actor(Iterator):
 
         :return: None if this actor is the nature, else the index of this player.
         """
-        return None if self.is_nature() else self.game.players.index(self)
+        return self._index
 
     def is_nature(self):
         """Returns whether or not if this actor is the nature.
 
         :return: True if this actor is the nature, else False.
         """
-        return self is self.game.nature
+        return self is self._game._nature
 
     def is_player(self):
         """Returns whether or not if this actor is one of the players.
 
         :return: True if this actor is one of the players, else False.
         """
-        return self in self.game.players
+        return self._index is not None
+
+    def _clone(self, game):
+        actor = copy(self)
+        actor._game = game
+
+        return actor
+
+    def _counterpart(self, game):
+        return game.nature if self.is_nature() else game.players[self.index]
+
+
+class RandomBuffer:
+    """RandomBuffer is the class for buffered random number generators.
+
+    Generators with vectorized draws (such as numpy.random.Generator), whose random methods accept the number of random
+    numbers to draw, are drawn from in batches, and the random numbers are handed out from the buffer. Other generators
+    (such as instances of random.Random) are drawn from directly. Each worker of a parallel simulation should use its
+    own buffer, with an independent seed, and share it among all of its games.
+
+    The random method of a buffer returns the next random number in the range [0, 1).
+
+    :param rng: The optional seed or random number generator (any object with a random method) to draw from.
+    :param size: The number of random numbers drawn per batch.
+    """
+
+    __slots__ = 'random', '_rng', '_size', '_values'
+
+    def __init__(self, rng=None, size=1024):
+        self._rng = rng if hasattr(rng, 'random') else random.Random(rng)
+        self._size = size
+        self._values = []
+
+        self.random = self._rng.random if isinstance(self._rng, random.Random) else self._pop
+
+    def choice(self, seq):
+        """Returns a random element of the non-empty sequence.
+
+        :param seq: The sequence to choose from.
+        :return: The random element.
+        """
+        return seq[int(self.random() * len(seq))]
+
+    def _pop(self):
+        if not self._values:
+            try:
+                values = self._rng.random(self._size)
+            except TypeError:
+                self.random = self._rng.random
+
+                return self.random()
+
+            self._values = values.tolist()
+
+        return self._values.pop()
+
+
+class _GlobalRandom:
+    __slots__ = ()
+
+    def __reduce__(self):
+        return '_GLOBAL_RANDOM'
+
+    @staticmethod
+    def random():
+        return random.random()
+
+    @staticmethod
+    def choice(seq):
+        return random.choice(seq)
+
+
+_GLOBAL_RANDOM = _GlobalRandom()
 
 
 class _Action(ABC):
+    __slots__ = 'actor',
+
     def __init__(self, actor):
         self.actor = actor
 
-    def act(self):
-        self.verify()
+    def act(self, checked=True):
+        if checked and self.actor._game._checked:
+            self.verify()
+
         self.apply()
 
     def can_act(self):
@@ -120,3 +266,9 @@ class _Action(ABC):
     @abstractmethod
     def apply(self):
         ...
+
+    def _clone(self, game):
+        action = copy(self)
+        action.actor = self.actor._counterpart(game)
+
+        return action
@@ -0,0 +1,265 @@
+"""This module defines various components of m,n,k-games.
+
+In m,n,k-games, two players take turns marking the cells of an m by n board, and the first player to mark k cells in a
+row (horizontally, vertically, or diagonally) wins. Tic tac toe is the 3,3,3-game and gomoku is the 15,15,5-game.
+"""
+from gameframe.exceptions import GameFrameError
+from gameframe.sequential import SequentialActor, SequentialGame, _SequentialAction
+
+_DIRECTIONS = (0, 1), (1, 0), (1, 1), (1, -1)
+
+
+class MNKGame(SequentialGame):
+    """MNKGame is the class for m,n,k-games.
+
+    Only the lines through the last marked cell are checked for a win, and the empty cells are kept in a list alongside
+    their positions in it, so marks (including random marks) take time proportional to k rather than to the size of the
+    board.
+
+    :param m: The number of rows of the board.
+    :param n: The number of columns of the board.
+    :param k: The number of cells in a row required to win.
+    :param rng: The optional seed or random number generator of this m,n,k-game.
+    """
+
+    __slots__ = '_m', '_n', '_k', '_cells', '_empty_cells', '_empty_cell_positions', '_board', '_winner'
+
+    def __init__(self, m=3, n=3, k=3, rng=None):
+        if m < 1 or n < 1 or k < 1:
+            raise ValueError('The board dimensions and the winning length must be positive')
+
+        super().__init__(0, SequentialActor(self), (MNKPlayer(self), MNKPlayer(self)), rng)
+
+        self._m = m
+        self._n = n
+        self._k = k
+        self._cells = [None] * (m * n)
+        self._empty_cells = list(range(m * n))
+        self._empty_cell_positions = list(range(m * n))
+        self._board = None
+        self._winner = None
+
+    @property
+    def m(self):
+        """Returns the number of rows of the board of this m,n,k-game.
+
+        :return: The number of rows of the board.
+        """
+        return self._m
+
+    @property
+    def n(self):
+        """Returns the number of columns of the board of this m,n,k-game.
+
+        :return: The number of columns of the board.
+        """
+        return self._n
+
+    @property
+    def k(self):
+        """Returns the number of cells in a row required to win this m,n,k-game.
+
+        :return: The number of cells in a row required to win.
+        """
+        return self._k
+
+    @property
+    def board(self):
+        """Returns the board of this m,n,k-game.
+
+        :return: The board of this m,n,k-game.
+        """
+        if self._board is None:
+            cells = tuple(None if index is None else self._players[index] for index in self._cells)
+            self._board = tuple(cells[r * self._n:(r + 1) * self._n] for r in range(self._m))
+
+        return self._board
+
+    @property
+    def empty_cell_locations(self):
+        """Returns the empty cell locations of the board of this m,n,k-game.
+
+        The locations are not in any particular order.
+
+        :return: An iterator of the empty coordinates of the board.
+        """
+        return (divmod(cell, self._n) for cell in self._empty_cells)
+
+    @property
+    def winner(self):
+        """Returns the winner of this m,n,k-game.
+
+        :return: The winning player of the m,n,k-game if there is one, else None.
+        """
+        return self._winner
+
+    @property
+    def loser(self):
+        """Returns the loser of this m,n,k-game.
+
+        :return: The losing player of the m,n,k-game if there is one, else None.
+        """
+        return None if self._winner is None else next(self._winner)
+
+    def clone(self):
+        game = super().clone()
+        game._cells = self._cells.copy()
+        game._empty_cells = self._empty_cells.copy()
+        game._empty_cell_positions = self._empty_cell_positions.copy()
+        game._board = None
+        game._winner = None if self._winner is None else self._winner._counterpart(game)
+
+        return game
+
+    def reset(self):
+        super().reset()
+
+        cell_count = self._m * self._n
+        self._cells[:] = (None,) * cell_count
+        self._empty_cells[:] = range(cell_count)
+        self._empty_cell_positions[:] = range(cell_count)
+        self._board = None
+        self._winner = None
+
+        return self
+
+    def mark(self, *coordinates, checked=True):
+        """Parses the coordinates (tuples of two integers) as mark actions and applies them to this m,n,k-game.
+
+        :param coordinates: The coordinates to mark.
+        :param checked: Whether or not to verify the mark actions.
+        :return: This game.
+        """
+        for r, c in coordinates:
+            self.actor.mark(r, c, checked)
+
+        return self
+
+    def _fill(self, cell, index):
+        position = self._empty_cell_positions[cell]
+        last_cell = self._empty_cells.pop()
+
+        if last_cell != cell:
+            self._empty_cells[position] = last_cell
+            self._empty_cell_positions[last_cell] = position
+
+        self._cells[cell] = index
+        self._board = None
+
+    def _clear(self, cell):
+        self._empty_cell_positions[cell] = len(self._empty_cells)
+        self._empty_cells.append(cell)
+        self._cells[cell] = None
+        self._board = None
+
+    def _is_winning(self, r, c):
+        index = self._cells[r * self._n + c]
+
+        for dr, dc in _DIRECTIONS:
+            length = 1
+
+            for sign in (1, -1):
+                row, column = r + sign * dr, c + sign * dc
+
+                while 0 <= row < self._m and 0 <= column < self._n and self._cells[row * self._n + column] == index:
+                    length += 1
+                    row, column = row + sign * dr, column + sign * dc
+
+            if length >= self._k:
+                return True
+
+        return False
+
+
+class MNKPlayer(SequentialActor):
+    """MNKPlayer is the class for m,n,k-game players."""
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return 'X' if self._index == 0 else 'O'
+
+    @property
+    def markable_cell_locations(self):
+        """Returns the locations of the cells that can be marked by this m,n,k-game player.
+
+        :return: An iterator of the coordinates this player can mark.
+        """
+        return self.game.empty_cell_locations if self.is_actor() else iter(())
+
+    def mark(self, r=None, c=None, checked=True):
+        """Marks the cell of the board at the optionally specified coordinates.
+
+        If the row and column numbers are not supplied, they are randomly determined among empty cells.
+        Either none or all of r and c must be provided.
+
+        :param r: The optional row number of the cell.
+        :param c: The optional column number of the cell.
+        :param checked: Whether or not to verify the mark action.
+        :return: None.
+        """
+        _MNKMarkAction(r, c, self).act(checked)
+
+    def can_mark(self, r=None, c=None):
+        """Determines if the cell of the board at the coordinates can be marked.
+
+        Either none or all of r and c must be provided.
+
+        :param r: The optional row number of the cell.
+        :param c: The optional column number of the cell.
+        :return: True if the cell can be marked, else False.
+        """
+        game = self._game
+
+        if r is None and c is None:
+            return self.is_actor()
+        elif isinstance(r, int) and isinstance(c, int):
+            return self.is_actor() and 0 <= r < game._m and 0 <= c < game._n and game._cells[r * game._n + c] is None
+        else:
+            return _MNKMarkAction(r, c, self).can_act()
+
+
+class _MNKMarkAction(_SequentialAction):
+    __slots__ = 'r', 'c'
+
+    def __init__(self, r, c, actor):
+        super().__init__(actor)
+
+        self.r = r
+        self.c = c
+
+    def verify(self):
+        super().verify()
+
+        game = self.actor.game
+
+        if self.r is not None and self.c is not None:
+            if not isinstance(self.r, int) or not isinstance(self.c, int):
+                raise TypeError('The coordinates must be of type integer')
+            elif not (0 <= self.r < game.m and 0 <= self.c < game.n):
+                raise GameFrameError('The coordinates must be within bounds')
+            elif game._cells[self.r * game.n + self.c] is not None:
+                raise GameFrameError('The cell to be marked must be empty')
+        elif self.r is not None or self.c is not None:
+            raise ValueError('Either all or no row-column coordinates should be supplied')
+
+    def apply(self):
+        game = self.actor.game
+
+        if self.r is None or self.c is None:
+            self.r, self.c = divmod(game._random.choice(game._empty_cells), game.n)
+
+        game._fill(self.r * game.n + self.c, self.actor.index)
+
+        if game._is_winning(self.r, self.c):
+            game._actor = None
+            game._winner = self.actor
+        elif not game._empty_cells:
+            game._actor = None
+        else:
+            game._actor = next(self.actor)
+
+    def revert(self):
+        game = self.actor.game
+        game._clear(self.r * game.n + self.c)
+        game._winner = None
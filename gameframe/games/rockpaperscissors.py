@@ -1,20 +1,49 @@
 """This module defines various components of rock paper scissors games."""
-from random import choice
+from auxiliary import IndexedEnum
 
-from auxiliary import IndexedEnum, maxima, minima
+from gameframe.game import Actor
+from gameframe.simultaneous import SimultaneousActor, SimultaneousGame, _SimultaneousAction
 
-from gameframe.exceptions import GameFrameError
-from gameframe.game import Actor, Game, _Action
 
+class RockPaperScissorsGame(SimultaneousGame):
+    """RockPaperScissorsGame is the class for rock paper scissors games.
 
-class RockPaperScissorsGame(Game):
-    """RockPaperScissorsGame is the class for rock paper scissors games."""
+    All players throw their hands simultaneously, and the game is terminal once every player has thrown a hand.
 
-    def __init__(self, player_count=2):
+    :param player_count: The number of players of this rock paper scissors game.
+    :param rng: The optional seed or random number generator of this rock paper scissors game.
+    """
+
+    __slots__ = '_unthrown_count', '_hand_counts'
+
+    def __init__(self, player_count=2, rng=None):
         if player_count < 2:
             raise ValueError('Rock paper scissors games require 2 or more players')
 
-        super().__init__(Actor(self), (RockPaperScissorsPlayer(self) for _ in range(player_count)))
+        super().__init__(Actor(self), (RockPaperScissorsPlayer(self) for _ in range(player_count)), rng)
+
+        self._unthrown_count = player_count
+        self._hand_counts = [0, 0, 0]
+
+    @property
+    def winning_hand(self):
+        """Determines the winning hand of this rock paper scissors game.
+
+        The hand is determined from the counts of the thrown hands, so it takes constant time.
+
+        :return: The winning hand if this game is terminal and has winners, else None.
+        """
+        return self._get_hand(1)
+
+    @property
+    def losing_hand(self):
+        """Determines the losing hand of this rock paper scissors game.
+
+        The hand is determined from the counts of the thrown hands, so it takes constant time.
+
+        :return: The losing hand if this game is terminal and has losers, else None.
+        """
+        return self._get_hand(-1)
 
     @property
     def winners(self):
@@ -22,12 +51,7 @@ class RockPaperScissorsGame(Game):
 
         :return: The winning players if this game is terminal, else None.
         """
-        if not self.is_terminal():
-            return None
-        elif len(set(map(RockPaperScissorsPlayer.hand.fget, self.players))) in (1, 3):
-            return iter(())
-        else:
-            return maxima(self.players, key=RockPaperScissorsPlayer.hand.fget)
+        return self._get_players(1)
 
     @property
     def losers(self):
@@ -35,34 +59,67 @@ class RockPaperScissorsGame(Game):
 
         :return: The losing players if this game is terminal, else None.
         """
-        if not self.is_terminal():
-            return None
-        elif len(set(map(RockPaperScissorsPlayer.hand.fget, self.players))) in (1, 3):
-            return iter(())
-        else:
-            return minima(self.players, key=RockPaperScissorsPlayer.hand.fget)
+        return self._get_players(-1)
+
+    def clone(self):
+        game = super().clone()
+        game._hand_counts = self._hand_counts.copy()
+
+        return game
+
+    def reset(self):
+        super().reset()
 
-    def throw(self, *hands):
-        """Throws the given hands.
+        for player in self._players:
+            player._hand = None
+
+        self._unthrown_count = len(self._players)
+        self._hand_counts[:] = 0, 0, 0
+
+        return self
+
+    def throw(self, *hands, checked=True):
+        """Throws the given hands for the players that did not throw a hand, in order.
+
+        The hands are thrown as a joint action, so either all or none of them are thrown. Extra hands are ignored, so
+        throwing hands in a terminal game does nothing.
 
         :param hands: The hands to throw.
+        :param checked: Whether or not to verify the throw actions.
         :return: This game.
         """
-        for player, hand in zip(filter(RockPaperScissorsPlayer.can_throw, self.players), hands):
-            player.throw(hand)
+        self._act((_ThrowAction(hand, player) for player, hand in zip(self.actors, hands)), checked)
 
         return self
 
     def is_terminal(self):
-        return all(map(RockPaperScissorsPlayer.hand.fget, self.players))
+        return not self._unthrown_count
+
+    def _get_hand(self, offset):
+        if self.is_terminal() and self._hand_counts.count(0) == 1:
+            for i, count in enumerate(self._hand_counts):
+                if count and self._hand_counts[(i - offset) % 3]:
+                    return _HANDS[i]
+
+        return None
+
+    def _get_players(self, offset):
+        if not self.is_terminal():
+            return None
+
+        hand = self._get_hand(offset)
+
+        return iter(()) if hand is None else (player for player in self._players if player._hand is hand)
 
 
-class RockPaperScissorsPlayer(Actor):
+class RockPaperScissorsPlayer(SimultaneousActor):
     """RockPaperScissorsPlayer is the class for rock paper scissors players.
 
     :param game: The game of this rock paper scissors actor.
     """
 
+    __slots__ = '_hand',
+
     def __init__(self, game):
         super().__init__(game)
 
@@ -77,15 +134,27 @@ class RockPaperScissorsPlayer(Actor):
         """
         return self._hand
 
-    def throw(self, hand=None):
+    @property
+    def throwable_hands(self):
+        """Returns the hands that this rock paper scissors player can throw.
+
+        :return: A tuple of the hands this player can throw.
+        """
+        return _HANDS if self._hand is None else ()
+
+    def is_actor(self):
+        return self._hand is None
+
+    def throw(self, hand=None, checked=True):
         """Throws the optionally specified hand.
 
         If the hand is not specified, a random rock paper scissors hand is thrown.
 
         :param hand: The optional hand to be thrown.
+        :param checked: Whether or not to verify the throw action.
         :return: None.
         """
-        _ThrowAction(hand, self).act()
+        _ThrowAction(hand, self).act(checked)
 
     def can_throw(self, hand=None):
         """Determines if this rock paper scissors player can throw a hand.
@@ -93,7 +162,10 @@ class RockPaperScissorsPlayer(Actor):
         :param hand: The optional hand to be thrown.
         :return: True if this rock paper scissors player can throw a hand, else False.
         """
-        return _ThrowAction(hand, self).can_act()
+        if hand is None or isinstance(hand, RockPaperScissorsHand):
+            return self._hand is None
+        else:
+            return _ThrowAction(hand, self).can_act()
 
 
 class RockPaperScissorsHand(IndexedEnum):
@@ -116,7 +188,12 @@ class RockPaperScissorsHand(IndexedEnum):
             return NotImplemented
 
 
-class _ThrowAction(_Action):
+_HANDS = tuple(RockPaperScissorsHand)
+
+
+class _ThrowAction(_SimultaneousAction):
+    __slots__ = 'hand',
+
     def __init__(self, hand, actor):
         super().__init__(actor)
 
@@ -125,12 +202,10 @@ class _ThrowAction(_Action):
     def verify(self):
         super().verify()
 
-        if self.hand is not None:
-            if not isinstance(self.hand, RockPaperScissorsHand):
-                raise TypeError('The hand to be thrown must be of type RockPaperScissorsHand')
-
-        if self.actor.hand is not None:
-            raise GameFrameError('The player must not have played a hand previously')
+        if self.hand is not None and not isinstance(self.hand, RockPaperScissorsHand):
+            raise TypeError('The hand to be thrown must be of type RockPaperScissorsHand')
 
     def apply(self):
-        self.actor._hand = choice(tuple(RockPaperScissorsHand)) if self.hand is None else self.hand
+        self.actor._hand = self.actor.game._random.choice(_HANDS) if self.hand is None else self.hand
+        self.actor.game._unthrown_count -= 1
+        self.actor.game._hand_counts[self.actor._hand.index] += 1
@@ -0,0 +1,198 @@
+"""This module defines batches of rock paper scissors games that are simulated with NumPy.
+
+Hands are represented by their indices in :class:`gameframe.games.rockpaperscissors.RockPaperScissorsHand` (0 for rock,
+1 for paper, and 2 for scissors). Hands that are not yet thrown are represented by -1.
+"""
+import numpy as np
+
+from gameframe.exceptions import GameFrameError
+
+
+class RockPaperScissorsBatch:
+    """RockPaperScissorsBatch is the class for batches of rock paper scissors games.
+
+    Each batch holds the hands of the players of every game in a game count by player count integer array. The winners
+    and losers of all games are resolved at once, following the same rules as
+    :class:`gameframe.games.rockpaperscissors.RockPaperScissorsGame`. The winning and losing hands of the games are
+    decided from the counts of the hands, so a single game with a million players can be resolved as a batch of one
+    game in a few passes over its hands.
+
+    :param game_count: The number of games in this batch.
+    :param player_count: The number of players in each game of this batch.
+    :param rng: The optional seed or NumPy generator used to throw random hands.
+    """
+
+    def __init__(self, game_count, player_count=2, rng=None):
+        if player_count < 2:
+            raise ValueError('Rock paper scissors games require 2 or more players')
+
+        self._hands = np.full((game_count, player_count), -1, dtype=np.int8)
+        self._rng = np.random.default_rng(rng)
+
+    @property
+    def game_count(self):
+        """Returns the number of games in this batch.
+
+        :return: The number of games in this batch.
+        """
+        return self._hands.shape[0]
+
+    @property
+    def player_count(self):
+        """Returns the number of players in each game of this batch.
+
+        :return: The number of players in each game of this batch.
+        """
+        return self._hands.shape[1]
+
+    @property
+    def hands(self):
+        """Returns the hand indices of this batch.
+
+        :return: A read-only game count by player count array of hand indices.
+        """
+        hands = self._hands.view()
+        hands.flags.writeable = False
+
+        return hands
+
+    @property
+    def winning_hands(self):
+        """Determines the winning hands of the games of this batch.
+
+        :return: An array of the winning hand indices (-1 for the games without winners) if all games are terminal, else
+                 None.
+        """
+        return self._get_hands(1)
+
+    @property
+    def losing_hands(self):
+        """Determines the losing hands of the games of this batch.
+
+        :return: An array of the losing hand indices (-1 for the games without losers) if all games are terminal, else
+                 None.
+        """
+        return self._get_hands(-1)
+
+    @property
+    def winners(self):
+        """Determines the winners of the games of this batch.
+
+        :return: A game count by player count boolean array of the winners if all games are terminal, else None.
+        """
+        return self._resolve(1)
+
+    @property
+    def losers(self):
+        """Determines the losers of the games of this batch.
+
+        :return: A game count by player count boolean array of the losers if all games are terminal, else None.
+        """
+        return self._resolve(-1)
+
+    def winner_indices(self, game_index=0):
+        """Determines the indices of the winners of the game of this batch.
+
+        :param game_index: The index of the game.
+        :return: An array of the indices of the winners if all games are terminal, else None.
+        """
+        return self._get_indices(game_index, 1)
+
+    def loser_indices(self, game_index=0):
+        """Determines the indices of the losers of the game of this batch.
+
+        :param game_index: The index of the game.
+        :return: An array of the indices of the losers if all games are terminal, else None.
+        """
+        return self._get_indices(game_index, -1)
+
+    def throw(self, hands=None):
+        """Throws the optionally specified hands for the players that did not throw a hand.
+
+        If the hands are not specified, random hands are thrown.
+
+        :param hands: The optional array of hand indices that is broadcastable to the shape of this batch.
+        :return: This batch.
+        """
+        if hands is None:
+            hands = self._rng.integers(3, size=self._hands.shape, dtype=np.int8)
+        else:
+            hands = np.broadcast_to(np.asarray(hands), self._hands.shape)
+
+            if not np.issubdtype(hands.dtype, np.integer):
+                raise TypeError('The hands to be thrown must be integer hand indices')
+            elif ((hands < 0) | (hands > 2)).any():
+                raise GameFrameError('The hand indices must be within bounds (from 0 to 2 inclusive)')
+
+        unthrown = self._hands < 0
+        self._hands[unthrown] = hands[unthrown]
+
+        return self
+
+    def is_terminal(self):
+        """Returns the terminal status of the games of this batch.
+
+        :return: True if all games of this batch are terminal, else False.
+        """
+        return bool((self._hands >= 0).all())
+
+    def _get_hands(self, offset):
+        if not self.is_terminal():
+            return None
+
+        game_count = self.game_count
+        counts = np.bincount((self._hands + 3 * np.arange(game_count)[:, None]).ravel(), minlength=3 * game_count)
+        present = counts.reshape(game_count, 3) > 0
+        resolved = present & np.roll(present, offset, axis=1) & (present.sum(axis=1) == 2)[:, None]
+
+        return np.where(resolved.any(axis=1), resolved.argmax(axis=1), -1)
+
+    def _get_indices(self, game_index, offset):
+        if not self.is_terminal():
+            return None
+
+        hand = self._get_hands(offset)[game_index]
+
+        return np.flatnonzero(self._hands[game_index] == hand) if hand >= 0 else np.empty(0, dtype=np.intp)
+
+    def _resolve(self, offset):
+        hands = self._get_hands(offset)
+
+        return None if hands is None else self._hands == hands[:, None]
+
+
+def play_tournament(player_count, rng=None):
+    """Plays a single-elimination rock paper scissors tournament with random hands.
+
+    In each round, the remaining players are paired up in order and the matches are played as a batch. The last player
+    of an odd number of players advances without a match. Tied matches are replayed until they are decided. As each
+    round halves the number of players, the tournament takes time linear in the number of players.
+
+    :param player_count: The number of players of the tournament.
+    :param rng: The optional seed or NumPy generator used to throw random hands.
+    :return: An array of the number of rounds survived by each player. The champion is the only player who survived
+             all rounds.
+    """
+    if player_count < 2:
+        raise ValueError('Rock paper scissors tournaments require 2 or more players')
+
+    rng = np.random.default_rng(rng)
+    rounds = np.zeros(player_count, dtype=np.int64)
+    remaining = np.arange(player_count)
+
+    while remaining.size > 1:
+        match_count = remaining.size // 2
+        matches = remaining[:2 * match_count].reshape(match_count, 2)
+        winners = np.empty(match_count, dtype=remaining.dtype)
+        undecided = np.arange(match_count)
+
+        while undecided.size:
+            won = RockPaperScissorsBatch(undecided.size, 2, rng).throw().winners
+            decided = won.any(axis=1)
+            winners[undecided[decided]] = matches[undecided[decided], won[decided, 1].astype(np.intp)]
+            undecided = undecided[~decided]
+
+        remaining = np.concatenate((winners, remaining[2 * match_count:]))
+        rounds[remaining] += 1
+
+    return rounds
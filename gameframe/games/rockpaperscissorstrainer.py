@@ -0,0 +1,219 @@
+"""This module defines the regret matching trainer of rock paper scissors strategies, which requires NumPy.
+
+The payoff matrix of the hands is derived from the comparisons of the rock paper scissors hands: a winning hand is paid
+1 and a losing hand is paid -1. As in :class:`gameframe.games.rockpaperscissors.RockPaperScissorsGame`, a game with more
+than 2 players only has winners and losers if exactly 2 distinct hands are thrown.
+
+In regret matching, each player plays the hands in proportion to the positive parts of its cumulative regrets of not
+having played them. In a normal-form game such as rock paper scissors, this is counterfactual regret minimization (CFR).
+The expected payoffs of the hands are computed exactly from the strategies with matrix operations rather than sampled
+from games, and the average strategies converge to an equilibrium in 2 player games.
+"""
+from time import time
+
+import numpy as np
+
+from gameframe.games.rockpaperscissors import _HANDS
+
+_SUBSET_COUNT = 1 << len(_HANDS)
+_SUBSETS = np.array([[subset >> i & 1 for subset in range(_SUBSET_COUNT)] for i in range(len(_HANDS))], dtype=float)
+_MOBIUS = np.array([
+    [
+        (-1) ** bin(superset ^ subset).count('1') if subset & superset == subset else 0
+        for superset in range(_SUBSET_COUNT)
+    ] for subset in range(_SUBSET_COUNT)
+], dtype=float)
+
+
+def get_payoff_matrix():
+    """Returns the payoff matrix of the rock paper scissors hands.
+
+    The entry at row i and column j is the payoff of the hand with index i against the hand with index j.
+
+    :return: The 3 by 3 payoff matrix.
+    """
+    return np.array([[(hand > other) - (hand < other) for other in _HANDS] for hand in _HANDS], dtype=float)
+
+
+class RockPaperScissorsTrainer:
+    """RockPaperScissorsTrainer is the class for regret matching trainers of rock paper scissors strategies.
+
+    The strategies are player count by 3 arrays of the probabilities of the hands (indexed as in
+    :class:`gameframe.games.rockpaperscissors.RockPaperScissorsHand`). The strategies of some players can be fixed, in
+    which case the other players learn to exploit them.
+
+    :param player_count: The number of players.
+    :param payoff_matrix: The optional 3 by 3 payoff matrix of the hands of a rock paper scissors variant. If it is
+                          None, the payoff matrix of rock paper scissors is used.
+    :param fixed_strategies: The optional strategies of the players whose strategies are fixed, keyed by the player
+                             indices.
+    :param plus: Whether or not to use regret matching+, in which the negative regrets are discarded and the later
+                 strategies are weighted more in the average strategies.
+    """
+
+    def __init__(self, player_count=2, payoff_matrix=None, fixed_strategies=None, plus=False):
+        if player_count < 2:
+            raise ValueError('Rock paper scissors games require 2 or more players')
+
+        payoff_matrix = get_payoff_matrix() if payoff_matrix is None else np.array(payoff_matrix, dtype=float)
+
+        if payoff_matrix.shape != (len(_HANDS), len(_HANDS)):
+            raise ValueError('The payoff matrix must be a 3 by 3 matrix')
+
+        payoffs = np.zeros((_SUBSET_COUNT, len(_HANDS)))
+
+        for subset in range(_SUBSET_COUNT):
+            for i in range(len(_HANDS)):
+                others = [j for j in range(len(_HANDS)) if (subset | 1 << i) >> j & 1 and j != i]
+
+                if len(others) == 1:
+                    payoffs[subset, i] = payoff_matrix[i, others[0]]
+
+        self._payoff_matrix = payoff_matrix
+        self._weights = _MOBIUS @ payoffs
+        self._plus = plus
+        self._fixed = np.zeros(player_count, dtype=bool)
+        self._fixed_strategies = np.zeros((player_count, len(_HANDS)))
+        self._regrets = np.zeros((player_count, len(_HANDS)))
+        self._strategy_sums = np.zeros((player_count, len(_HANDS)))
+        self._iteration_count = 0
+
+        if fixed_strategies is not None:
+            for index, strategy in fixed_strategies.items():
+                self._fixed[index] = True
+                self._fixed_strategies[index] = self._normalize(strategy)
+
+    @property
+    def player_count(self):
+        """Returns the number of players of this trainer.
+
+        :return: The number of players of this trainer.
+        """
+        return len(self._regrets)
+
+    @property
+    def payoff_matrix(self):
+        """Returns the payoff matrix of the hands of this trainer.
+
+        :return: The 3 by 3 payoff matrix.
+        """
+        return self._payoff_matrix.copy()
+
+    @property
+    def iteration_count(self):
+        """Returns the number of iterations this trainer has run.
+
+        :return: The number of iterations this trainer has run.
+        """
+        return self._iteration_count
+
+    @property
+    def strategies(self):
+        """Returns the current strategies of this trainer.
+
+        :return: The player count by 3 array of the current strategies.
+        """
+        positive_regrets = np.maximum(self._regrets, 0)
+        totals = positive_regrets.sum(axis=1, keepdims=True)
+        strategies = np.divide(positive_regrets, totals, out=np.full_like(positive_regrets, 1 / 3), where=totals > 0)
+        strategies[self._fixed] = self._fixed_strategies[self._fixed]
+
+        return strategies
+
+    @property
+    def average_strategies(self):
+        """Returns the average strategies of this trainer, which approximate an equilibrium.
+
+        :return: The player count by 3 array of the average strategies.
+        """
+        if not self._iteration_count:
+            return self.strategies
+
+        strategies = self._strategy_sums / self._strategy_sums.sum(axis=1, keepdims=True)
+        strategies[self._fixed] = self._fixed_strategies[self._fixed]
+
+        return strategies
+
+    def train(self, iterations=None, duration=None):
+        """Runs the iterations of this trainer until the iteration or time budget is exhausted.
+
+        :param iterations: The optional maximum number of iterations.
+        :param duration: The optional maximum number of seconds.
+        :return: This trainer.
+        """
+        if iterations is None and duration is None:
+            raise ValueError('Either the iteration or time budget must be supplied')
+
+        init_time = time()
+        count = 0
+
+        while (iterations is None or count < iterations) and (duration is None or time() - init_time < duration):
+            self._iterate()
+            count += 1
+
+        return self
+
+    def utilities(self, strategies):
+        """Computes the expected payoffs of the hands of each player against the strategies of the other players.
+
+        The payoffs are computed exactly, in time linear in the number of players.
+
+        :param strategies: The player count by 3 array of the strategies.
+        :return: The player count by 3 array of the expected payoffs of the hands.
+        """
+        return self._get_utilities(self._normalize(strategies))
+
+    def exploitability(self, strategies=None):
+        """Computes the exploitability of the strategies.
+
+        The exploitability is the mean of the payoffs each player would gain by switching to its best response, which
+        is 0 at an equilibrium.
+
+        :param strategies: The optional player count by 3 array of the strategies. If it is None, the average strategies
+                           are used.
+        :return: The exploitability of the strategies.
+        """
+        strategies = self.average_strategies if strategies is None else self._normalize(strategies)
+        utilities = self._get_utilities(strategies)
+
+        return float((utilities.max(axis=1) - (strategies * utilities).sum(axis=1)).mean())
+
+    def best_responses(self, strategies=None):
+        """Computes the best responses of the players to the strategies of the other players.
+
+        :param strategies: The optional player count by 3 array of the strategies. If it is None, the average strategies
+                           are used.
+        :return: An array of the hand indices of the best responses.
+        """
+        return self.utilities(self.average_strategies if strategies is None else strategies).argmax(axis=1)
+
+    def _iterate(self):
+        strategies = self.strategies
+        utilities = self._get_utilities(strategies)
+        values = (strategies * utilities).sum(axis=1, keepdims=True)
+
+        np.add(self._regrets, utilities - values, out=self._regrets, where=~self._fixed[:, None])
+
+        if self._plus:
+            np.maximum(self._regrets, 0, out=self._regrets)
+
+        self._iteration_count += 1
+        self._strategy_sums += (self._iteration_count if self._plus else 1) * strategies
+
+    def _get_utilities(self, strategies):
+        masses = strategies @ _SUBSETS
+        zeros = masses == 0
+        logarithms = np.log(np.where(zeros, 1, masses))
+        probabilities = np.exp(logarithms.sum(axis=0) - logarithms)
+        probabilities[zeros.sum(axis=0) - zeros > 0] = 0
+
+        return probabilities @ self._weights
+
+    @staticmethod
+    def _normalize(strategies):
+        strategies = np.asarray(strategies, dtype=float)
+
+        if strategies.shape[-1] != len(_HANDS) or (strategies < 0).any() or not np.allclose(strategies.sum(axis=-1), 1):
+            raise ValueError('The strategies must be probability distributions over the 3 hands')
+
+        return strategies
@@ -1,20 +1,41 @@
 """This module defines various components of tic tac toe games."""
-from itertools import filterfalse, product
-from random import choice
-
-from auxiliary import next_or_none
+from collections import deque
+from collections.abc import Sequence
 
 from gameframe.exceptions import GameFrameError
 from gameframe.sequential import SequentialActor, SequentialGame, _SequentialAction
 
 
+_FULL_BITBOARD = 0b111111111
+_WIN_MASKS = 0b000000111, 0b000111000, 0b111000000, 0b001001001, 0b010010010, 0b100100100, 0b100010001, 0b001010100
+_WINNING = tuple(any(bitboard & mask == mask for mask in _WIN_MASKS) for bitboard in range(_FULL_BITBOARD + 1))
+_LOCATIONS = tuple(
+    tuple(divmod(i, 3) for i in range(9) if bitboard >> i & 1) for bitboard in range(_FULL_BITBOARD + 1)
+)
+
+
 class TicTacToeGame(SequentialGame):
-    """TicTacToeGame is the class for tic tac toe games."""
+    """TicTacToeGame is the class for tic tac toe games.
+
+    Internally, the board is stored as two 9-bit integers (one per player), where the bit at index 3 * r + c is set if
+    the cell at row r and column c is marked by the corresponding player.
+
+    The changes of the board can be followed without copying the board through :meth:`TicTacToeGame.board_view` and
+    :meth:`TicTacToeGame.changes`.
+
+    :param rng: The optional seed or random number generator of this tic tac toe game.
+    """
 
-    def __init__(self):
-        super().__init__(0, SequentialActor(self), (TicTacToePlayer(self), TicTacToePlayer(self)))
+    __slots__ = '_bitboards', '_board', '_board_view', '_change_streams', '_winner'
 
-        self._board = [[None, None, None], [None, None, None], [None, None, None]]
+    def __init__(self, rng=None):
+        super().__init__(0, SequentialActor(self), (TicTacToePlayer(self), TicTacToePlayer(self)), rng)
+
+        self._bitboards = [0, 0]
+        self._board = None
+        self._board_view = None
+        self._change_streams = []
+        self._winner = None
 
     @property
     def board(self):
@@ -22,7 +43,25 @@ class TicTacToeGame(SequentialGame):
 
         :return: The board of this tic tac toe game.
         """
-        return tuple(map(tuple, self._board))
+        if self._board is None:
+            cells = tuple(map(self._get_cell, range(9)))
+            self._board = cells[0:3], cells[3:6], cells[6:9]
+
+        return self._board
+
+    @property
+    def board_view(self):
+        """Returns the read-only view of the board of this tic tac toe game.
+
+        Unlike the board, the view is not rebuilt after each mark. It reads the cells from this game when they are
+        accessed, so it always reflects the current board. The cells can be accessed as view[r][c].
+
+        :return: The view of the board of this tic tac toe game.
+        """
+        if self._board_view is None:
+            self._board_view = TicTacToeBoardView(self)
+
+        return self._board_view
 
     @property
     def empty_cell_locations(self):
@@ -30,7 +69,15 @@ class TicTacToeGame(SequentialGame):
 
         :return: An iterator of the empty coordinates of the board.
         """
-        return filterfalse(self._get_cell, product(range(3), range(3)))
+        return iter(_LOCATIONS[~(self._bitboards[0] | self._bitboards[1]) & _FULL_BITBOARD])
+
+    @property
+    def mark_mask(self):
+        """Returns the legality mask of the marks of the actor of this tic tac toe game.
+
+        :return: The 9-bit mask of the cells the actor can mark, which is 0 if this game is terminal.
+        """
+        return 0 if self._actor is None else ~(self._bitboards[0] | self._bitboards[1]) & _FULL_BITBOARD
 
     @property
     def winner(self):
@@ -38,17 +85,7 @@ class TicTacToeGame(SequentialGame):
 
         :return: The winning player of the tic tac toe game if there is one, else None.
         """
-        for i in range(3):
-            if self.board[i][0] is self.board[i][1] is self.board[i][2] is not None:
-                return self.board[i][0]
-            elif self.board[0][i] is self.board[1][i] is self.board[2][i] is not None:
-                return self.board[0][i]
-
-        if self.board[1][1] is not None and (self.board[0][0] is self.board[1][1] is self.board[2][2]
-                                             or self.board[0][2] is self.board[1][1] is self.board[2][0]):
-            return self.board[1][1]
-
-        return None
+        return self._winner
 
     @property
     def loser(self):
@@ -58,28 +95,177 @@ class TicTacToeGame(SequentialGame):
         """
         return None if self.winner is None else next(self.winner)
 
-    def mark(self, *coordinates):
+    def clone(self):
+        game = super().clone()
+        game._bitboards = self._bitboards.copy()
+        game._board = None
+        game._board_view = None
+        game._change_streams = []
+        game._winner = None if self._winner is None else self._winner._counterpart(game)
+
+        return game
+
+    def reset(self):
+        super().reset()
+
+        if self._change_streams:
+            for r, c in _LOCATIONS[self._bitboards[0] | self._bitboards[1]]:
+                self._push_change(r, c, None)
+
+        self._bitboards[0] = self._bitboards[1] = 0
+        self._board = None
+        self._winner = None
+
+        return self
+
+    def mark(self, *coordinates, checked=True):
         """Parses the coordinates (tuples of two integers) as mark actions and applies them to this tic tac toe game.
 
         :param coordinates: The coordinates to mark.
+        :param checked: Whether or not to verify the mark actions.
         :return: This game.
         """
         for r, c in coordinates:
-            self.actor.mark(r, c)
+            self.actor.mark(r, c, checked)
 
         return self
 
-    def _get_cell(self, coords):
-        return self.board[coords[0]][coords[1]]
+    def changes(self):
+        """Returns a stream of the changes of the board of this tic tac toe game.
+
+        :return: The stream of the changes of the board.
+        """
+        return TicTacToeChangeStream(self)
+
+    def _get_cell(self, i):
+        if self._bitboards[0] >> i & 1:
+            return self._players[0]
+        elif self._bitboards[1] >> i & 1:
+            return self._players[1]
+        else:
+            return None
+
+    def _push_change(self, r, c, player):
+        for stream in self._change_streams:
+            stream._queue.append(((r, c), player))
+
+
+class TicTacToeBoardView(Sequence):
+    """TicTacToeBoardView is the class for read-only views of tic tac toe boards.
+
+    The view is a sequence of the 3 rows of the board, each of which is a sequence of the 3 cells in the row. The cells
+    are either the players who marked them or None.
+
+    :param game: The tic tac toe game to view.
+    """
+
+    __slots__ = '_rows',
+
+    def __init__(self, game):
+        self._rows = tuple(_TicTacToeRowView(game, r) for r in range(3))
+
+    def __getitem__(self, r):
+        return self._rows[r]
+
+    def __len__(self):
+        return 3
+
+    def __repr__(self):
+        return repr(tuple(map(tuple, self._rows)))
+
+
+class _TicTacToeRowView(Sequence):
+    __slots__ = '_game', '_cells'
+
+    def __init__(self, game, r):
+        self._game = game
+        self._cells = range(3 * r, 3 * r + 3)
+
+    def __getitem__(self, c):
+        cells = self._cells[c]
+
+        return self._game._get_cell(cells) if isinstance(cells, int) else tuple(map(self._game._get_cell, cells))
+
+    def __len__(self):
+        return 3
+
+    def __repr__(self):
+        return repr(tuple(self))
+
+
+class TicTacToeChangeStream:
+    """TicTacToeChangeStream is the class for streams of the changes of tic tac toe boards.
+
+    Each change is a tuple of the coordinates of a cell and its new value, which is the player who marked it or None if
+    it was cleared (when a mark is undone or the game is reset). Iterating over a stream yields the changes made since
+    the last iteration, so consumers only process what changed. The stream keeps collecting the changes until it is
+    closed. Streams can be used as context managers.
+
+    :param game: The tic tac toe game to follow.
+    """
+
+    __slots__ = '_game', '_queue'
+
+    def __init__(self, game):
+        self._game = game
+        self._queue = deque()
+
+        game._change_streams.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return self._queue.popleft()
+        except IndexError:
+            raise StopIteration from None
+
+    def __len__(self):
+        return len(self._queue)
+
+    def close(self):
+        """Stops collecting the changes of the board. Closing a closed stream has no effect.
+
+        :return: None.
+        """
+        if self in self._game._change_streams:
+            self._game._change_streams.remove(self)
 
 
 class TicTacToePlayer(SequentialActor):
     """TicTacToePlayer is the class for tic tac toe players."""
 
+    __slots__ = ()
+
     def __repr__(self):
-        return 'X' if self.game.players[0] is self else 'O'
+        return 'X' if self._index == 0 else 'O'
+
+    @property
+    def mark_mask(self):
+        """Returns the legality mask of the marks of this tic tac toe player.
+
+        The bit at index 3 * r + c is set if the cell at row r and column c can be marked by this player.
+
+        :return: The 9-bit mask of the cells this player can mark.
+        """
+        return self.game.mark_mask if self.is_actor() else 0
+
+    @property
+    def markable_cell_locations(self):
+        """Returns the locations of the cells that can be marked by this tic tac toe player.
+
+        :return: An iterator of the coordinates this player can mark.
+        """
+        return iter(_LOCATIONS[self.mark_mask])
 
-    def mark(self, r=None, c=None):
+    def mark(self, r=None, c=None, checked=True):
         """Marks the cell of the board at the optionally specified coordinates.
 
         If the row and column numbers are not supplied, they are randomly determined among empty cells.
@@ -87,9 +273,10 @@ class TicTacToePlayer(SequentialActor):
 
         :param r: The optional row number of the cell.
         :param c: The optional column number of the cell.
+        :param checked: Whether or not to verify the mark action.
         :return: None.
         """
-        _MarkAction(r, c, self).act()
+        _MarkAction(r, c, self).act(checked)
 
     def can_mark(self, r=None, c=None):
         """Determines if the cell of the board at the coordinates can be marked.
@@ -100,10 +287,17 @@ class TicTacToePlayer(SequentialActor):
         :param c: The optional column number of the cell.
         :return: True if the cell can be marked, else False.
         """
-        return _MarkAction(r, c, self).can_act()
+        if r is None and c is None:
+            return self.mark_mask != 0
+        elif isinstance(r, int) and isinstance(c, int):
+            return 0 <= r < 3 and 0 <= c < 3 and self.mark_mask >> (3 * r + c) & 1 == 1
+        else:
+            return _MarkAction(r, c, self).can_act()
 
 
 class _MarkAction(_SequentialAction):
+    __slots__ = 'r', 'c'
+
     def __init__(self, r, c, actor):
         super().__init__(actor)
 
@@ -118,7 +312,7 @@ class _MarkAction(_SequentialAction):
                 raise TypeError('The coordinates must be of type integer')
             elif not (0 <= self.r < 3 and 0 <= self.c < 3):
                 raise GameFrameError('The coordinates must be within bounds (from 0 to 3 inclusive)')
-            elif self.actor.game.board[self.r][self.c] is not None:
+            elif (self.actor.game._bitboards[0] | self.actor.game._bitboards[1]) >> (3 * self.r + self.c) & 1:
                 raise GameFrameError('The cell to be marked must be empty')
         elif self.r is not None or self.c is not None:
             raise ValueError('Either all or no row-column coordinates should be supplied')
@@ -127,11 +321,28 @@ class _MarkAction(_SequentialAction):
         game = self.actor.game
 
         if self.r is None or self.c is None:
-            self.r, self.c = choice(tuple(game.empty_cell_locations))
+            self.r, self.c = game._random.choice(_LOCATIONS[game.mark_mask])
 
-        game._board[self.r][self.c] = self.actor
+        index = self.actor.index
+        game._bitboards[index] |= 1 << (3 * self.r + self.c)
+        game._board = None
 
-        if next_or_none(game.empty_cell_locations) is not None and game.winner is None:
-            game._actor = next(self.actor)
-        else:
+        if game._change_streams:
+            game._push_change(self.r, self.c, self.actor)
+
+        if _WINNING[game._bitboards[index]]:
+            game._actor = None
+            game._winner = self.actor
+        elif game._bitboards[0] | game._bitboards[1] == _FULL_BITBOARD:
             game._actor = None
+        else:
+            game._actor = next(self.actor)
+
+    def revert(self):
+        game = self.actor.game
+        game._bitboards[self.actor.index] &= ~(1 << (3 * self.r + self.c))
+        game._board = None
+        game._winner = None
+
+        if game._change_streams:
+            game._push_change(self.r, self.c, None)
@@ -0,0 +1,155 @@
+"""This module defines the perft (performance test) enumeration of tic tac toe game trees.
+
+Perft walks every line of play from a position through the public interface of the game (the markable cell locations,
+the mark actions, and the undoing of them) and counts the positions reached at each depth along with the outcomes of
+the terminal positions. As the counts of the full game tree are well known, perft checks the move generator and the
+outcome detection, and its speed benchmarks them.
+"""
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from time import time
+
+from gameframe.games.tictactoe import TicTacToeGame
+from gameframe.games.tictactoesolver import _SYMMETRIES
+
+_DRAW = 2
+
+
+class PerftResult:
+    """PerftResult is the class for the results of perft enumerations.
+
+    :param node_counts: The numbers of positions reached at each depth.
+    :param outcomes: The counter of the outcomes of the terminal positions.
+    :param duration: The number of seconds the enumeration took.
+    """
+
+    def __init__(self, node_counts, outcomes, duration):
+        self._node_counts = node_counts
+        self._outcomes = outcomes
+        self._duration = duration
+
+    @property
+    def node_counts(self):
+        """Returns the numbers of positions reached at each depth.
+
+        The first count is that of the root position, so it is always 1.
+
+        :return: A tuple of the numbers of positions reached at each depth.
+        """
+        return self._node_counts
+
+    @property
+    def leaf_count(self):
+        """Returns the number of positions reached at the maximum depth.
+
+        :return: The number of positions reached at the maximum depth.
+        """
+        return self._node_counts[-1]
+
+    @property
+    def outcomes(self):
+        """Returns the counts of the outcomes of the terminal positions reached.
+
+        The outcomes are the indices of the winners, or None for draws.
+
+        :return: The counter of the outcomes of the terminal positions.
+        """
+        return self._outcomes
+
+    @property
+    def duration(self):
+        """Returns the number of seconds the enumeration took.
+
+        :return: The number of seconds the enumeration took.
+        """
+        return self._duration
+
+    @property
+    def speed(self):
+        """Returns the number of positions reached per second.
+
+        :return: The number of positions reached per second.
+        """
+        return sum(self.node_counts) / self.duration if self.duration else float('inf')
+
+
+def perft(game, depth, memoize=False, process_count=1):
+    """Enumerates the positions reachable from the tic tac toe game within the depth.
+
+    If memoization is enabled, the counts of each position are computed once, and positions that are identical up to
+    the symmetries of the board share them. This is much faster, but it skips most of the move generation, so it should
+    not be used to benchmark the game itself.
+
+    If there is more than one process, the subtrees of the root are enumerated by a pool of processes.
+
+    :param game: The tic tac toe game to enumerate from. It is left unchanged.
+    :param depth: The maximum depth (the number of marks) of the enumeration.
+    :param memoize: Whether or not to memoize the counts of the positions.
+    :param process_count: The number of processes. If it is None, the number of CPUs is used.
+    :return: The result of the enumeration.
+    """
+    if depth < 0:
+        raise ValueError('The depth must be non-negative')
+
+    init_time = time()
+
+    if process_count == 1 or game.is_terminal() or not depth:
+        node_counts, outcome_counts = _perft(game.clone(), depth, {} if memoize else None)
+    else:
+        moves = tuple((action.r, action.c) for action in game._actions)
+        node_counts = [1] + [0] * depth
+        outcome_counts = [0] * 3
+
+        with ProcessPoolExecutor(process_count) as executor:
+            futures = [
+                executor.submit(_perft_subtree, moves + ((r, c),), depth - 1, memoize)
+                for r, c in game.actor.markable_cell_locations
+            ]
+
+            for future in futures:
+                _accumulate(node_counts, outcome_counts, *future.result())
+
+    outcomes = Counter({0: outcome_counts[0], 1: outcome_counts[1], None: outcome_counts[_DRAW]})
+
+    return PerftResult(tuple(node_counts), +outcomes, time() - init_time)
+
+
+def _perft_subtree(moves, depth, memoize):
+    return _perft(TicTacToeGame().mark(*moves), depth, {} if memoize else None)
+
+
+def _perft(game, depth, memo):
+    if memo is not None:
+        key = min(symmetry[game._bitboards[0]] << 9 | symmetry[game._bitboards[1]] for symmetry in _SYMMETRIES), depth
+        result = memo.get(key)
+
+        if result is not None:
+            return result
+
+    node_counts = [1] + [0] * depth
+    outcome_counts = [0] * 3
+
+    if game.is_terminal():
+        outcome_counts[_DRAW if game.winner is None else game.winner.index] += 1
+    elif depth:
+        actor = game.actor
+
+        for r, c in tuple(actor.markable_cell_locations):
+            actor.mark(r, c)
+            _accumulate(node_counts, outcome_counts, *_perft(game, depth - 1, memo))
+            game.undo()
+
+    result = tuple(node_counts), tuple(outcome_counts)
+
+    if memo is not None:
+        memo[key] = result
+
+    return result
+
+
+def _accumulate(node_counts, outcome_counts, child_node_counts, child_outcome_counts):
+    for i, count in enumerate(child_node_counts, 1):
+        node_counts[i] += count
+
+    for i, count in enumerate(child_outcome_counts):
+        outcome_counts[i] += count
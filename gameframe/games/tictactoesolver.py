@@ -0,0 +1,93 @@
+"""This module defines the perfect-play solver of tic tac toe games."""
+from gameframe.games.tictactoe import _FULL_BITBOARD, _LOCATIONS, _WINNING
+
+
+def _transform(function):
+    permutation = tuple(3 * r + c for r, c in (function(*divmod(i, 3)) for i in range(9)))
+
+    return tuple(
+        sum(1 << permutation[i] for i in range(9) if bitboard >> i & 1) for bitboard in range(_FULL_BITBOARD + 1)
+    )
+
+
+_SYMMETRIES = tuple(map(_transform, (
+    lambda r, c: (r, c),
+    lambda r, c: (c, 2 - r),
+    lambda r, c: (2 - r, 2 - c),
+    lambda r, c: (2 - c, r),
+    lambda r, c: (r, 2 - c),
+    lambda r, c: (2 - r, c),
+    lambda r, c: (c, r),
+    lambda r, c: (2 - c, 2 - r),
+)))
+
+
+class TicTacToeSolver:
+    """TicTacToeSolver is the class for perfect-play tic tac toe solvers.
+
+    The solver memoizes the values of the positions it visits in a transposition table. Positions that are identical up
+    to the 8 symmetries of the board (rotations and reflections) share the same entry, so solving the empty board visits
+    each of the 765 distinct positions exactly once.
+
+    Values are 1 for a win, 0 for a draw, and -1 for a loss.
+    """
+
+    def __init__(self):
+        self._table = {}
+
+    def __len__(self):
+        return len(self._table)
+
+    def value(self, game):
+        """Returns the game-theoretic value of the tic tac toe game for its first player.
+
+        :param game: The tic tac toe game to evaluate.
+        :return: The value of the game for the first player under perfect play.
+        """
+        value = self._solve(*self._split(game))
+
+        return value if self._first_to_act(game) else -value
+
+    def best_moves(self, game):
+        """Returns the coordinates of the optimal marks for the actor of the tic tac toe game.
+
+        :param game: The tic tac toe game to evaluate.
+        :return: A tuple of the optimal coordinates, which is empty if the game is terminal.
+        """
+        if game.is_terminal():
+            return ()
+
+        actor, opponent = self._split(game)
+        values = {(r, c): -self._solve(opponent, actor | 1 << (3 * r + c)) for r, c in game.empty_cell_locations}
+        best_value = max(values.values())
+
+        return tuple(location for location, value in values.items() if value == best_value)
+
+    def _solve(self, actor, opponent):
+        key = min(symmetry[actor] << 9 | symmetry[opponent] for symmetry in _SYMMETRIES)
+        value = self._table.get(key)
+
+        if value is None:
+            if _WINNING[opponent]:
+                value = -1
+            elif actor | opponent == _FULL_BITBOARD:
+                value = 0
+            else:
+                value = max(
+                    -self._solve(opponent, actor | 1 << (3 * r + c))
+                    for r, c in _LOCATIONS[~(actor | opponent) & _FULL_BITBOARD]
+                )
+
+            self._table[key] = value
+
+        return value
+
+    @staticmethod
+    def _first_to_act(game):
+        return bin(game._bitboards[0]).count('1') == bin(game._bitboards[1]).count('1')
+
+    def _split(self, game):
+        if self._first_to_act(game):
+            return game._bitboards[0], game._bitboards[1]
+        else:
+            return game._bitboards[1], game._bitboards[0]
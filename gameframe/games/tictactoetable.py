@@ -0,0 +1,173 @@
+"""This module defines the precomputed lookup table of tic tac toe positions.
+
+The table has an entry for each of the 3 ** 9 boards, indexed by the base-3 encoding of the board, in which the cell at
+row r and column c is the digit 3 * r + c (0 if it is empty, 1 if it is marked by the first player, and 2 if it is
+marked by the second player). Each entry consists of 2 bytes:
+
+- The first byte holds the winner (bits 0 to 1, which are 0 if there is no winner, else the index of the winner plus 1),
+  the terminality (bit 2), and the game-theoretic value for the first player (bits 3 to 4, which are the value plus 1).
+- The second byte holds the cell index 3 * r + c of the lowest optimal mark (255 if the board is terminal).
+
+The table is shipped with the package as a binary file, which is opened as a memory map, so its entries are looked up
+in constant time without being loaded. The file can be regenerated by running this module:
+
+.. code-block:: console
+
+   python -m gameframe.games.tictactoetable
+"""
+from mmap import ACCESS_READ, mmap
+from os.path import dirname, join
+
+from gameframe.exceptions import GameFrameError
+from gameframe.games.tictactoe import _FULL_BITBOARD, _WINNING
+from gameframe.games.tictactoesolver import TicTacToeSolver
+
+PATH = join(dirname(__file__), 'tictactoetable.bin')
+"""The path of the table shipped with the package."""
+
+_ENTRY_COUNT = 3 ** 9
+_NO_MOVE = 255
+_TERNARY = tuple(sum(3 ** i for i in range(9) if bitboard >> i & 1) for bitboard in range(_FULL_BITBOARD + 1))
+
+
+def generate_table():
+    """Generates the table of tic tac toe positions.
+
+    :return: The bytes of the table.
+    """
+    solver = TicTacToeSolver()
+    table = bytearray(2 * _ENTRY_COUNT)
+
+    for index in range(_ENTRY_COUNT):
+        bitboards = [0, 0]
+
+        for i in range(9):
+            digit = index // 3 ** i % 3
+
+            if digit:
+                bitboards[digit - 1] |= 1 << i
+
+        if _WINNING[bitboards[0]]:
+            winner = 1
+        elif _WINNING[bitboards[1]]:
+            winner = 2
+        else:
+            winner = 0
+
+        terminal = bool(winner) or bitboards[0] | bitboards[1] == _FULL_BITBOARD
+        counts = bin(bitboards[0]).count('1'), bin(bitboards[1]).count('1')
+        value = 0
+        move = _NO_MOVE
+
+        if counts[0] - counts[1] in (0, 1):
+            actor_index = counts[0] - counts[1]
+            actor, opponent = bitboards[actor_index], bitboards[1 - actor_index]
+            value = solver._solve(actor, opponent) * (-1 if actor_index else 1)
+
+            if not terminal:
+                values = {
+                    i: -solver._solve(opponent, actor | 1 << i) for i in range(9) if ~(actor | opponent) >> i & 1
+                }
+                move = max(values, key=lambda i: (values[i], -i))
+
+        table[2 * index] = winner | terminal << 2 | (value + 1) << 3
+        table[2 * index + 1] = move
+
+    return bytes(table)
+
+
+def get_index(game):
+    """Returns the base-3 encoding of the board of the tic tac toe game.
+
+    :param game: The tic tac toe game to encode.
+    :return: The index of the board in the table.
+    """
+    return _TERNARY[game._bitboards[0]] + 2 * _TERNARY[game._bitboards[1]]
+
+
+class TicTacToeTable:
+    """TicTacToeTable is the class for lookup tables of tic tac toe positions.
+
+    The table is opened as a read-only memory map. Tables can be used as context managers.
+
+    :param path: The optional path of the table file. If it is None, the table shipped with the package is used.
+    """
+
+    def __init__(self, path=None):
+        with open(PATH if path is None else path, 'rb') as file:
+            self._table = mmap(file.fileno(), 0, access=ACCESS_READ)
+
+        if len(self._table) != 2 * _ENTRY_COUNT:
+            self._table.close()
+
+            raise ValueError('The table file is malformed')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return _ENTRY_COUNT
+
+    def winner(self, game):
+        """Looks up the winner of the tic tac toe game.
+
+        :param game: The tic tac toe game to look up.
+        :return: The winning player of the game if there is one, else None.
+        """
+        winner = self._table[2 * get_index(game)] & 0b11
+
+        return game.players[winner - 1] if winner else None
+
+    def is_terminal(self, game):
+        """Looks up the terminal status of the tic tac toe game.
+
+        :param game: The tic tac toe game to look up.
+        :return: True if the game is terminal, else False.
+        """
+        return bool(self._table[2 * get_index(game)] & 0b100)
+
+    def value(self, game):
+        """Looks up the game-theoretic value of the tic tac toe game for its first player.
+
+        :param game: The tic tac toe game to look up.
+        :return: The value of the game for the first player under perfect play.
+        """
+        return (self._table[2 * get_index(game)] >> 3) - 1
+
+    def best_move(self, game):
+        """Looks up an optimal mark for the actor of the tic tac toe game.
+
+        :param game: The tic tac toe game to look up.
+        :return: The coordinates of the optimal mark, or None if the game is terminal.
+        """
+        move = self._table[2 * get_index(game) + 1]
+
+        return None if move == _NO_MOVE else divmod(move, 3)
+
+    def mark(self, game):
+        """Marks an optimal cell for the actor of the tic tac toe game.
+
+        :param game: The non-terminal tic tac toe game to mark.
+        :return: None.
+        """
+        move = self.best_move(game)
+
+        if move is None:
+            raise GameFrameError('Actions can only be applied to non-terminal games')
+
+        game.actor.mark(*move)
+
+    def close(self):
+        """Closes the memory map of this table.
+
+        :return: None.
+        """
+        self._table.close()
+
+
+if __name__ == '__main__':
+    with open(PATH, 'wb') as table_file:
+        table_file.write(generate_table())
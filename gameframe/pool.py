@@ -0,0 +1,52 @@
+"""This module defines the pools of reusable games in GameFrame."""
+from contextlib import contextmanager
+
+
+class GamePool:
+    """GamePool is the class for pools of reusable games.
+
+    Released games are reset in place and handed out again by later acquisitions, so loops that play many short games
+    do not have to allocate a new game (and its actors) for each of them.
+
+    :param factory: The callable that creates a new game when no released game is available.
+    :param max_size: The optional maximum number of released games kept by this pool.
+    """
+
+    def __init__(self, factory, max_size=None):
+        self._factory = factory
+        self._max_size = max_size
+        self._games = []
+
+    def __len__(self):
+        return len(self._games)
+
+    def acquire(self):
+        """Acquires a game in its initial state from this pool.
+
+        :return: A released game if there is one, else a new game.
+        """
+        return self._games.pop() if self._games else self._factory()
+
+    def release(self, game):
+        """Resets the game and returns it to this pool.
+
+        The game must not be used after it is released.
+
+        :param game: The game to release.
+        :return: None.
+        """
+        if self._max_size is None or len(self._games) < self._max_size:
+            self._games.append(game.reset())
+
+    @contextmanager
+    def game(self):
+        """Acquires a game that is released when the context exits.
+
+        :return: A context manager of the acquired game.
+        """
+        game = self.acquire()
+
+        try:
+            yield game
+        finally:
+            self.release(game)
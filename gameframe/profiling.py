@@ -0,0 +1,190 @@
+"""This module defines the action-level profiling of games in GameFrame.
+
+When profiling is enabled, the calls to the act and can_act methods of all actions are counted per action class, and
+the time spent verifying and applying the actions is accumulated. The instrumented methods are only installed while
+profiling is enabled, so disabled profiling costs nothing.
+
+Joint actions of simultaneous games are not counted themselves. Instead, each of their actions is counted and timed
+under its own class.
+
+Note that some legality checks (e.g. :meth:`gameframe.games.tictactoe.TicTacToePlayer.can_mark` with well-typed
+arguments) are answered without creating actions, and are therefore not counted.
+"""
+from contextlib import contextmanager
+from time import perf_counter
+
+from gameframe.exceptions import GameFrameError
+from gameframe.game import _Action
+from gameframe.simultaneous import _JointAction
+
+
+class _Counters:
+    __slots__ = 'act_count', 'rejected_act_count', 'verify_time', 'apply_time', 'check_count', 'rejected_check_count'
+
+    def __init__(self):
+        self.act_count = 0
+        self.rejected_act_count = 0
+        self.verify_time = 0.0
+        self.apply_time = 0.0
+        self.check_count = 0
+        self.rejected_check_count = 0
+
+
+_original_act = _Action.act
+_original_can_act = _Action.can_act
+_counters = {}
+
+
+def _get_counters(action):
+    action_type = type(action)
+
+    try:
+        return _counters[action_type]
+    except KeyError:
+        counters = _counters[action_type] = _Counters()
+
+        return counters
+
+
+def _profiled_act(self, checked=True):
+    if isinstance(self, _JointAction):
+        _profile_joint_act(self, checked)
+
+        return
+
+    counters = _get_counters(self)
+    counters.act_count += 1
+    init_time = perf_counter()
+
+    try:
+        if checked and self.actor._game._checked:
+            self.verify()
+    except GameFrameError:
+        counters.rejected_act_count += 1
+        raise
+    finally:
+        verify_time = perf_counter()
+        counters.verify_time += verify_time - init_time
+
+    try:
+        self.apply()
+    finally:
+        counters.apply_time += perf_counter() - verify_time
+
+
+def _profile_joint_act(self, checked):
+    counters = tuple(map(_get_counters, self.actions))
+
+    for action_counters in counters:
+        action_counters.act_count += 1
+
+    if checked and self.actor._game._checked:
+        try:
+            self._verify_actors()
+
+            for action, action_counters in zip(self.actions, counters):
+                init_time = perf_counter()
+
+                try:
+                    action.verify()
+                finally:
+                    action_counters.verify_time += perf_counter() - init_time
+        except GameFrameError:
+            for action_counters in counters:
+                action_counters.rejected_act_count += 1
+
+            raise
+
+    for action, action_counters in zip(self.actions, counters):
+        init_time = perf_counter()
+
+        try:
+            action.apply()
+        finally:
+            action_counters.apply_time += perf_counter() - init_time
+
+
+def _profiled_can_act(self):
+    counters = _get_counters(self)
+    counters.check_count += 1
+    init_time = perf_counter()
+
+    try:
+        self.verify()
+    except GameFrameError:
+        counters.rejected_check_count += 1
+
+        return False
+    else:
+        return True
+    finally:
+        counters.verify_time += perf_counter() - init_time
+
+
+def enable():
+    """Enables the profiling of actions.
+
+    :return: None.
+    """
+    _Action.act = _profiled_act
+    _Action.can_act = _profiled_can_act
+
+
+def disable():
+    """Disables the profiling of actions. The collected statistics are kept.
+
+    :return: None.
+    """
+    _Action.act = _original_act
+    _Action.can_act = _original_can_act
+
+
+def is_enabled():
+    """Returns whether or not if the profiling of actions is enabled.
+
+    :return: True if the profiling of actions is enabled, else False.
+    """
+    return _Action.act is _profiled_act
+
+
+def reset():
+    """Clears the collected statistics.
+
+    :return: None.
+    """
+    _counters.clear()
+
+
+def get_statistics():
+    """Returns the collected statistics.
+
+    The statistics of each action class are a dictionary with the following entries:
+
+    - act_count: The number of calls to act.
+    - rejected_act_count: The number of calls to act that were rejected by verification.
+    - verify_time: The total number of seconds spent verifying in act and can_act.
+    - apply_time: The total number of seconds spent applying in act.
+    - check_count: The number of calls to can_act.
+    - rejected_check_count: The number of calls to can_act that returned False.
+
+    :return: A dictionary of the statistics keyed by the qualified names of the action classes.
+    """
+    return {
+        f'{action_type.__module__}.{action_type.__qualname__}': {
+            name: getattr(counters, name) for name in _Counters.__slots__
+        } for action_type, counters in _counters.items()
+    }
+
+
+@contextmanager
+def profile():
+    """Enables the profiling of actions within the context.
+
+    :return: A context manager that disables the profiling on exit.
+    """
+    enable()
+
+    try:
+        yield
+    finally:
+        disable()
@@ -0,0 +1,172 @@
+"""This module defines the compact binary records of games in GameFrame.
+
+Each record consists of a header and a payload. The header holds the game type (one byte), the player count and the
+payload length (both as unsigned LEB128 variable-length integers). The payload depends on the game type:
+
+- Tic tac toe: one byte per mark, holding the cell index 3 * r + c, in the order of the marks.
+- Rock paper scissors: two bits per player, holding the hand index (3 if no hand was thrown), four players per byte.
+
+Records are appended one after another, so logs can be written and read as streams.
+"""
+from io import BytesIO
+
+from gameframe.games.rockpaperscissors import RockPaperScissorsGame, RockPaperScissorsHand
+from gameframe.games.tictactoe import TicTacToeGame
+
+_TIC_TAC_TOE = 0
+_ROCK_PAPER_SCISSORS = 1
+_HANDS = tuple(RockPaperScissorsHand)
+_UNTHROWN = 3
+
+
+def encode(game):
+    """Encodes the game as a record.
+
+    :param game: The tic tac toe or rock paper scissors game to encode.
+    :return: The bytes of the record.
+    """
+    if isinstance(game, TicTacToeGame):
+        game_type = _TIC_TAC_TOE
+        payload = bytes(3 * action.r + action.c for action in game._actions)
+    elif isinstance(game, RockPaperScissorsGame):
+        game_type = _ROCK_PAPER_SCISSORS
+        payload = bytearray((len(game.players) + 3) // 4)
+
+        for i, player in enumerate(game.players):
+            payload[i // 4] |= (_UNTHROWN if player.hand is None else player.hand.index) << (2 * (i % 4))
+    else:
+        raise TypeError('Only tic tac toe and rock paper scissors games can be encoded')
+
+    return bytes((game_type,)) + _encode_varint(len(game.players)) + _encode_varint(len(payload)) + payload
+
+
+def decode(data):
+    """Decodes the record as a game.
+
+    :param data: The bytes of the record.
+    :return: The replayed game.
+    """
+    games = read_records(BytesIO(data))
+    game = next(games, None)
+
+    if game is None or next(games, None) is not None:
+        raise ValueError('The data must contain exactly one record')
+
+    return game
+
+
+def read_records(file):
+    """Reads the records in the file as games.
+
+    The records are read and replayed lazily, one at a time, so the file is never loaded into memory as a whole.
+
+    :param file: The path or the binary file object to read from.
+    :return: A generator of the replayed games.
+    """
+    if not hasattr(file, 'read'):
+        with open(file, 'rb') as file:
+            yield from read_records(file)
+
+        return
+
+    while True:
+        header = file.read(1)
+
+        if not header:
+            break
+
+        player_count = _read_varint(file)
+        payload = _read_exactly(file, _read_varint(file))
+
+        if header[0] == _TIC_TAC_TOE:
+            yield TicTacToeGame().mark(*(divmod(cell, 3) for cell in payload))
+        elif header[0] == _ROCK_PAPER_SCISSORS:
+            game = RockPaperScissorsGame(player_count)
+
+            for i, player in enumerate(game.players):
+                hand = payload[i // 4] >> (2 * (i % 4)) & 0b11
+
+                if hand != _UNTHROWN:
+                    player.throw(_HANDS[hand])
+
+            yield game
+        else:
+            raise ValueError(f'Unknown game type {header[0]}')
+
+
+class RecordWriter:
+    """RecordWriter is the class for writers of game records.
+
+    The records are appended to the file. Writers can be used as context managers.
+
+    :param file: The path or the binary file object to append the records to.
+    """
+
+    def __init__(self, file):
+        if hasattr(file, 'write'):
+            self._file = file
+            self._owned = False
+        else:
+            self._file = open(file, 'ab')
+            self._owned = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, *games):
+        """Appends the records of the games.
+
+        :param games: The games to write.
+        :return: This writer.
+        """
+        for game in games:
+            self._file.write(encode(game))
+
+        return self
+
+    def close(self):
+        """Closes this writer. The file is only closed if it was opened by this writer.
+
+        :return: None.
+        """
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+
+def _encode_varint(value):
+    data = bytearray()
+
+    while value >= 0x80:
+        data.append(value & 0x7F | 0x80)
+        value >>= 7
+
+    data.append(value)
+
+    return bytes(data)
+
+
+def _read_varint(file):
+    value = 0
+    shift = 0
+
+    while True:
+        byte = _read_exactly(file, 1)[0]
+        value |= (byte & 0x7F) << shift
+        shift += 7
+
+        if byte < 0x80:
+            return value
+
+
+def _read_exactly(file, size):
+    data = file.read(size)
+
+    if len(data) != size:
+        raise ValueError('The record is truncated')
+
+    return data
@@ -0,0 +1,161 @@
+"""This module defines the registry of games in GameFrame.
+
+The registry maps the names of games to their factories. Factories can be registered as references of the form
+'module:attribute', in which case their modules are only imported when the factories are first used. Games of other
+packages are discovered through the 'gameframe.games' entry point group, which is only scanned when a name is not
+registered otherwise.
+
+.. code-block:: toml
+
+   [project.entry-points.'gameframe.games']
+   chess = 'mypackage.chess:ChessGame'
+"""
+from collections.abc import Mapping
+from importlib import import_module
+
+ENTRY_POINT_GROUP = 'gameframe.games'
+"""The entry point group of the games of other packages."""
+
+
+class GameRegistry(Mapping):
+    """GameRegistry is the class for registries of games.
+
+    Registries are mappings from the names of games to their factories, which are loaded when they are first looked up.
+    Games are added and removed through the register and unregister methods.
+
+    :param factories: The optional factories or references to them, keyed by the game names.
+    :param entry_point_group: The optional entry point group to discover games from. If it is None, entry points are not
+                              used.
+    """
+
+    def __init__(self, factories=None, entry_point_group=None):
+        self._factories = {}
+        self._entry_point_group = entry_point_group
+        self._entry_points = None
+
+        if factories is not None:
+            for name, factory in factories.items():
+                self.register(name, factory)
+
+    def __getitem__(self, name):
+        factory = self._factories.get(name)
+
+        if factory is None:
+            entry_point = self._get_entry_points().get(name)
+
+            if entry_point is None:
+                raise KeyError(name)
+
+            factory = self._factories[name] = entry_point.load()
+        elif isinstance(factory, str):
+            module_name, _, attribute_name = factory.partition(':')
+            factory = self._factories[name] = getattr(import_module(module_name), attribute_name)
+
+        return factory
+
+    def __contains__(self, name):
+        return name in self._factories or name in self._get_entry_points()
+
+    def __iter__(self):
+        return iter(self._factories.keys() | self._get_entry_points().keys())
+
+    def __len__(self):
+        return len(self._factories.keys() | self._get_entry_points().keys())
+
+    def register(self, name, factory):
+        """Registers the game factory under the name.
+
+        :param name: The name of the game.
+        :param factory: The factory of the game, or the reference to it of the form 'module:attribute'.
+        :return: None.
+        """
+        if name in self._factories:
+            raise ValueError(f'The game {name!r} is already registered')
+        elif isinstance(factory, str) and ':' not in factory:
+            raise ValueError('The factory references must be of the form \'module:attribute\'')
+        elif not isinstance(factory, str) and not callable(factory):
+            raise TypeError('The factories must be callable')
+
+        self._factories[name] = factory
+
+    def unregister(self, name):
+        """Removes the game factory registered under the name.
+
+        :param name: The name of the game.
+        :return: None.
+        """
+        try:
+            del self._factories[name]
+        except KeyError:
+            raise ValueError(f'Unknown game {name!r}') from None
+
+    def select(self, *names):
+        """Returns a registry of the games with the names.
+
+        The factories are not loaded, and the returned registry does not discover games from entry points.
+
+        :param names: The names of the games.
+        :return: The registry of the selected games.
+        """
+        factories = {}
+
+        for name in names:
+            factory = self._factories.get(name)
+
+            if factory is None:
+                entry_point = self._get_entry_points().get(name)
+
+                if entry_point is None:
+                    raise ValueError(f'Unknown game {name!r}')
+
+                factory = entry_point.value
+
+            factories[name] = factory
+
+        return GameRegistry(factories)
+
+    def create(self, name, *args, **kwargs):
+        """Creates a game.
+
+        :param name: The name of the game.
+        :param args: The positional arguments of the factory.
+        :param kwargs: The keyword arguments of the factory.
+        :return: The created game.
+        """
+        try:
+            factory = self[name]
+        except KeyError:
+            raise ValueError(f'Unknown game {name!r}') from None
+
+        return factory(*args, **kwargs)
+
+    def _get_entry_points(self):
+        if self._entry_points is None:
+            self._entry_points = {}
+
+            if self._entry_point_group is not None:
+                try:
+                    from importlib.metadata import entry_points
+                except ImportError:  # Python 3.7
+                    pass
+                else:
+                    discovered_entry_points = entry_points()
+
+                    if hasattr(discovered_entry_points, 'select'):
+                        discovered_entry_points = discovered_entry_points.select(group=self._entry_point_group)
+                    else:
+                        discovered_entry_points = discovered_entry_points.get(self._entry_point_group, ())
+
+                    for entry_point in discovered_entry_points:
+                        self._entry_points.setdefault(entry_point.name, entry_point)
+
+        return self._entry_points
+
+
+GAMES = GameRegistry({
+    'tictactoe': 'gameframe.games.tictactoe:TicTacToeGame',
+    'rockpaperscissors': 'gameframe.games.rockpaperscissors:RockPaperScissorsGame',
+    'rockpaperscissorsbatch': 'gameframe.games.rockpaperscissorsbatch:RockPaperScissorsBatch',
+    'mnk': 'gameframe.games.mnk:MNKGame',
+}, ENTRY_POINT_GROUP)
+"""The default registry of games, which holds the games of GameFrame and those of other packages."""
@@ -0,0 +1,39 @@
+"""This module defines the rollouts of games in GameFrame.
+
+A rollout plays a game to the end with a policy. The actions are applied unchecked, so the policy must only choose legal
+actions, such as the optimal marks of a :class:`gameframe.games.tictactoetable.TicTacToeTable`.
+"""
+from gameframe.games.mnk import MNKGame
+from gameframe.games.rockpaperscissors import RockPaperScissorsGame
+from gameframe.games.tictactoe import TicTacToeGame
+
+
+def rollout(game, policy=None):
+    """Plays the game to the end with the policy.
+
+    The policy is called with the game and the actor in turn to act, and returns the coordinates to mark in tic tac toe
+    games and m,n,k-games or the hand to throw in rock paper scissors games. In rock paper scissors games, the hands of
+    all actors are chosen before any of them are thrown.
+
+    :param game: The tic tac toe game, m,n,k-game, or rock paper scissors game to play.
+    :param policy: The optional policy. If it is None, random actions are applied.
+    :return: The game.
+    """
+    if isinstance(game, (TicTacToeGame, MNKGame)):
+        while game._actor is not None:
+            actor = game._actor
+
+            if policy is None:
+                actor.mark(checked=False)
+            else:
+                actor.mark(*policy(game, actor), checked=False)
+    elif isinstance(game, RockPaperScissorsGame):
+        actors = game.actors
+        hands = [None] * len(actors) if policy is None else [policy(game, actor) for actor in actors]
+
+        for actor, hand in zip(actors, hands):
+            actor.throw(hand, False)
+    else:
+        raise TypeError('Only tic tac toe games, m,n,k-games, and rock paper scissors games can be rolled out')
+
+    return game
@@ -0,0 +1,110 @@
+"""This module defines the parallel runner of games in GameFrame.
+
+The runner plays games across a pool of processes. The callables supplied to the runner are sent to the worker
+processes, so they must be picklable (e.g. functions defined at the top level of a module).
+"""
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from math import ceil
+from os import cpu_count
+from time import time
+
+
+class RunResult:
+    """RunResult is the class for the results of runs.
+
+    :param game_count: The number of games played.
+    :param outcomes: The counter of the outcomes of the games.
+    :param duration: The number of seconds the run took.
+    """
+
+    def __init__(self, game_count, outcomes, duration):
+        self._game_count = game_count
+        self._outcomes = outcomes
+        self._duration = duration
+
+    @property
+    def game_count(self):
+        """Returns the number of games played.
+
+        :return: The number of games played.
+        """
+        return self._game_count
+
+    @property
+    def outcomes(self):
+        """Returns the counts of the outcomes of the games played.
+
+        :return: The counter of the outcomes of the games.
+        """
+        return self._outcomes
+
+    @property
+    def duration(self):
+        """Returns the number of seconds the run took.
+
+        :return: The number of seconds the run took.
+        """
+        return self._duration
+
+    @property
+    def speed(self):
+        """Returns the number of games played per second.
+
+        :return: The number of games played per second.
+        """
+        return self.game_count / self.duration if self.duration else float('inf')
+
+
+def run(create_game, act, game_count, outcome=None, process_count=None, batch_size=None, seed=None):
+    """Plays the games across a pool of processes.
+
+    The games are split into batches, each of which is played by a single worker process. Before playing a batch, the
+    worker seeds the random module with a seed drawn from the seed of the run, so runs with the same seed and batch size
+    are reproducible regardless of the number of processes.
+
+    :param create_game: The callable that creates a game.
+    :param act: The callable that applies an action to a non-terminal game.
+    :param game_count: The number of games to play.
+    :param outcome: The optional callable that returns the hashable outcome of a terminal game.
+    :param process_count: The optional number of worker processes. If it is None, the number of CPUs is used.
+    :param batch_size: The optional number of games per batch. If it is None, each process receives 4 batches.
+    :param seed: The optional seed of the run.
+    :return: The result of the run.
+    """
+    if process_count is None:
+        process_count = cpu_count() or 1
+
+    if batch_size is None:
+        batch_size = max(ceil(game_count / (4 * process_count)), 1)
+
+    rng = random.Random(seed)
+    batches = []
+
+    for i in range(0, game_count, batch_size):
+        batches.append((create_game, act, outcome, min(batch_size, game_count - i), rng.getrandbits(64)))
+
+    init_time = time()
+    outcomes = Counter()
+
+    with ProcessPoolExecutor(process_count) as executor:
+        for batch_outcomes in executor.map(_play_batch, *zip(*batches)):
+            outcomes.update(batch_outcomes)
+
+    return RunResult(game_count, outcomes, time() - init_time)
+
+
+def _play_batch(create_game, act, outcome, game_count, seed):
+    random.seed(seed)
+    outcomes = Counter()
+
+    for _ in range(game_count):
+        game = create_game()
+
+        while not game.is_terminal():
+            act(game)
+
+        outcomes[None if outcome is None else outcome(game)] += 1
+
+    return outcomes
@@ -0,0 +1,223 @@
+"""This module defines the Monte Carlo tree search for sequential games in GameFrame.
+
+The search is game-agnostic. The moves of games are supplied through callables, and the actors in turn to act are
+determined through :attr:`gameframe.sequential.SequentialGame.actor`. The searched games must support
+:meth:`gameframe.sequential.SequentialGame.undo`.
+"""
+from array import array
+from math import log, sqrt
+from random import Random
+from time import time
+
+
+class MonteCarloTreeSearch:
+    """MonteCarloTreeSearch is the class for Monte Carlo tree searches over sequential games.
+
+    The statistics of the nodes are stored in flat arrays indexed by node ids rather than in node objects. Player nodes
+    are selected through UCT, and nature nodes are selected uniformly at random.
+
+    :param game: The sequential game to search. The game is cloned, and the original game is never modified.
+    :param moves: The callable that returns the legal moves of a non-terminal game.
+    :param play: The callable that applies a move to a game.
+    :param payoffs: The callable that returns the payoffs of the players of a terminal game.
+    :param policy: The optional rollout policy that chooses a move given a game and its moves. If it is None, moves are
+                   chosen uniformly at random.
+    :param exploration: The exploration constant of UCT.
+    :param rng: The optional seed or random.Random instance of this search.
+    """
+
+    def __init__(self, game, moves, play, payoffs, policy=None, exploration=sqrt(2), rng=None):
+        self._game = game.clone()
+        self._moves = moves
+        self._play = play
+        self._payoffs = payoffs
+        self._random = rng if isinstance(rng, Random) else Random(rng)
+        self._policy = self._random_policy if policy is None else policy
+        self._exploration = exploration
+
+        self._reset()
+
+    @property
+    def game(self):
+        """Returns the game at the root of this search.
+
+        :return: The game at the root of this search.
+        """
+        return self._game
+
+    @property
+    def node_count(self):
+        """Returns the number of nodes in the tree of this search.
+
+        :return: The number of nodes in the tree of this search.
+        """
+        return len(self._visits)
+
+    def search(self, iterations=None, duration=None):
+        """Runs the iterations of this search until the iteration or time budget is exhausted.
+
+        :param iterations: The optional maximum number of iterations.
+        :param duration: The optional maximum number of seconds.
+        :return: This search.
+        """
+        if iterations is None and duration is None:
+            raise ValueError('Either the iteration or time budget must be supplied')
+
+        init_time = time()
+        count = 0
+
+        while (iterations is None or count < iterations) and (duration is None or time() - init_time < duration):
+            self._iterate()
+            count += 1
+
+        return self
+
+    def statistics(self):
+        """Returns the statistics of the moves at the root of this search.
+
+        :return: A tuple of (move, visit count, mean payoff) triples.
+        """
+        return tuple(
+            (self._node_moves[child], self._visits[child], self._values[child] / self._visits[child])
+            for child in self._children[self._root]
+        )
+
+    def best_move(self):
+        """Returns the most visited move at the root of this search.
+
+        :return: The most visited move, or None if no move was searched.
+        """
+        children = self._children[self._root]
+
+        return self._node_moves[max(children, key=self._visits.__getitem__)] if children else None
+
+    def advance(self, move):
+        """Applies the move to the game at the root of this search and reuses the corresponding subtree.
+
+        :param move: The move to apply.
+        :return: This search.
+        """
+        self._play(self._game, move)
+
+        for child in self._children[self._root]:
+            if self._node_moves[child] == move:
+                self._reroot(child)
+                break
+        else:
+            self._reset()
+
+        return self
+
+    def _reset(self):
+        self._parents = array('q')
+        self._actors = array('q')
+        self._visits = array('q')
+        self._values = array('d')
+        self._node_moves = []
+        self._children = []
+        self._untried = []
+
+        self._root = self._add_node(-1, None, -1)
+
+    def _add_node(self, parent, move, actor_index):
+        node = len(self._visits)
+
+        self._parents.append(parent)
+        self._actors.append(actor_index)
+        self._visits.append(0)
+        self._values.append(0)
+        self._node_moves.append(move)
+        self._children.append([])
+
+        if self._game.is_terminal():
+            self._untried.append([])
+        else:
+            untried = list(self._moves(self._game))
+            self._random.shuffle(untried)
+            self._untried.append(untried)
+
+        return node
+
+    def _reroot(self, root):
+        parents, actors, visits, values = self._parents, self._actors, self._visits, self._values
+        node_moves, children, untried = self._node_moves, self._children, self._untried
+
+        self._parents = array('q')
+        self._actors = array('q')
+        self._visits = array('q')
+        self._values = array('d')
+        self._node_moves = []
+        self._children = []
+        self._untried = []
+
+        ids = {root: 0}
+        queue = [root]
+
+        for node in queue:
+            self._parents.append(ids.get(parents[node], -1))
+            self._actors.append(actors[node])
+            self._visits.append(visits[node])
+            self._values.append(values[node])
+            self._node_moves.append(node_moves[node])
+            self._untried.append(untried[node])
+
+            for child in children[node]:
+                ids[child] = len(queue)
+                queue.append(child)
+
+        for node in queue:
+            self._children.append([ids[child] for child in children[node]])
+
+        self._root = 0
+
+    def _iterate(self):
+        game = self._game
+        node = self._root
+        depth = 0
+
+        while not self._untried[node] and self._children[node]:
+            node = self._select(node)
+            self._play(game, self._node_moves[node])
+            depth += 1
+
+        if self._untried[node]:
+            move = self._untried[node].pop()
+            actor_index = -1 if game.actor.is_nature() else game.actor.index
+
+            self._play(game, move)
+            depth += 1
+
+            child = self._add_node(node, move, actor_index)
+            self._children[node].append(child)
+            node = child
+
+        while not game.is_terminal():
+            self._play(game, self._policy(game, tuple(self._moves(game))))
+            depth += 1
+
+        payoffs = self._payoffs(game)
+
+        for _ in range(depth):
+            game.undo()
+
+        while node != -1:
+            self._visits[node] += 1
+
+            if self._actors[node] != -1:
+                self._values[node] += payoffs[self._actors[node]]
+
+            node = self._parents[node]
+
+    def _select(self, node):
+        children = self._children[node]
+
+        if self._actors[children[0]] == -1:
+            return self._random.choice(children)
+
+        scale = self._exploration * sqrt(log(self._visits[node]))
+        visits, values = self._visits, self._values
+
+        return max(children, key=lambda child: values[child] / visits[child] + scale / sqrt(visits[child]))
+
+    def _random_policy(self, game, moves):
+        return self._random.choice(moves)
@@ -2,7 +2,7 @@
 
 All elements of sequential games in GameFrame should inherit from the classes defined here.
 """
-from abc import ABC
+from abc import ABC, abstractmethod
 
 from gameframe.exceptions import GameFrameError
 from gameframe.game import Actor, Game, _Action
@@ -17,12 +17,17 @@ class SequentialGame(Game, ABC):
     :param actor_index: The initial actor index. If it is None, the initial actor is set to the nature.
     :param nature: The nature of this game.
     :param players: The players of this game.
+    :param rng: The optional seed or random number generator of this game.
     """
 
-    def __init__(self, actor_index, nature, players):
-        super().__init__(nature, players)
+    __slots__ = '_initial_actor', '_actor', '_actions'
 
-        self._actor = self.nature if actor_index is None else self.players[actor_index]
+    def __init__(self, actor_index, nature, players, rng=None):
+        super().__init__(nature, players, rng)
+
+        self._initial_actor = self.nature if actor_index is None else self.players[actor_index]
+        self._actor = self._initial_actor
+        self._actions = []
 
     @property
     def actor(self):
@@ -32,9 +37,40 @@ class SequentialGame(Game, ABC):
         """
         return self._actor
 
+    def clone(self):
+        game = super().clone()
+        game._initial_actor = self._initial_actor._counterpart(game)
+        game._actor = None if self._actor is None else self._actor._counterpart(game)
+        game._actions = [action._clone(game) for action in self._actions]
+
+        return game
+
     def is_terminal(self):
         return self.actor is None
 
+    def reset(self):
+        super().reset()
+
+        self._actor = self._initial_actor
+        self._actions.clear()
+
+        return self
+
+    def undo(self):
+        """Undoes the last action applied to this sequential game.
+
+        :return: This game.
+        """
+        if not self._actions:
+            raise GameFrameError('There must be an action to undo')
+
+        action = self._actions[-1]
+        action.revert()
+        self._actions.pop()
+        self._actor = action.actor
+
+        return self
+
 
 class SequentialActor(Actor):
     """SequentialActor is the class for sequential actors.
@@ -42,15 +78,28 @@ class SequentialActor(Actor):
     Sequential actors can only act in turn.
     """
 
+    __slots__ = ()
+
     def is_actor(self):
         """Returns whether or not if this actor is in turn to act.
 
         :return: True if this actor is in turn to act, else False.
         """
-        return self is self.game.actor
+        return self is self._game._actor
 
 
 class _SequentialAction(_Action, ABC):
+    __slots__ = ()
+
+    def act(self, checked=True):
+        super().act(checked)
+
+        self.actor.game._actions.append(self)
+
+    @abstractmethod
+    def revert(self):
+        ...
+
     def verify(self):
         super().verify()
 
@@ -0,0 +1,352 @@
+"""This module defines the asyncio game session server of GameFrame.
+
+A session manager hosts many concurrent game sessions. Actions are routed to the sessions by their ids and are applied
+under per-session locks, so sessions never wait for each other. After each action, the new state of the session is
+pushed to its subscribers. Closing a session ends the subscriptions to it.
+
+Messages and states are JSON-serializable dictionaries. The loopback transport exchanges them with a session manager in
+the same process, which is useful for testing clients offline.
+"""
+import json
+from asyncio import Lock, Queue, ensure_future
+from itertools import count
+
+from gameframe.registry import GAMES
+from gameframe.sequential import SequentialGame
+from gameframe.simultaneous import SimultaneousGame
+
+GAME_TYPES = GAMES.select('tictactoe', 'rockpaperscissors', 'mnk')
+"""The default registry of the game factories of session managers.
+
+The games are selected from :data:`gameframe.registry.GAMES`, and their modules are only imported when they are first
+created. The games of other packages are not exposed to clients unless a registry that includes them is supplied."""
+
+ARGUMENT_LIMITS = {
+    'tictactoe': (),
+    'rockpaperscissors': (100,),
+    'mnk': (100, 100, 100),
+}
+"""The upper bounds of the integer arguments of the game factories that can be supplied when sessions are created,
+keyed by the game names. Games without an entry cannot be created with arguments."""
+
+ACTIONS = {
+    'mark': lambda player, r=None, c=None: player.mark(r, c),
+    'throw': lambda player, hand=None: player.throw(None if hand is None else _get_hand(hand)),
+}
+"""The actions that can be routed to the players of the sessions, keyed by the action names."""
+
+
+def _get_hand(value):
+    from gameframe.games.rockpaperscissors import RockPaperScissorsHand
+
+    return RockPaperScissorsHand(value)
+
+
+class Session:
+    """Session is the class for game sessions.
+
+    :param session_id: The id of this session.
+    :param game_name: The name of the game type of this session.
+    :param game: The game of this session.
+    """
+
+    def __init__(self, session_id, game_name, game):
+        self._id = session_id
+        self._game_name = game_name
+        self._game = game
+        self._version = 0
+        self._lock = Lock()
+        self._subscribers = []
+        self._closed = False
+
+    @property
+    def id(self):
+        """Returns the id of this session.
+
+        :return: The id of this session.
+        """
+        return self._id
+
+    @property
+    def game(self):
+        """Returns the game of this session.
+
+        :return: The game of this session.
+        """
+        return self._game
+
+    @property
+    def closed(self):
+        """Returns whether or not if this session is closed.
+
+        :return: True if this session is closed, else False.
+        """
+        return self._closed
+
+    @property
+    def state(self):
+        """Returns the state of this session.
+
+        :return: The JSON-serializable state of this session.
+        """
+        game = self._game
+        state = {'session': self._id, 'game': self._game_name, 'version': self._version, 'terminal': game.is_terminal()}
+
+        if isinstance(game, SequentialGame):
+            state['actor'] = None if game.actor is None else game.actor.index
+        elif isinstance(game, SimultaneousGame):
+            state['actors'] = [actor.index for actor in game.actors]
+
+        if hasattr(game, 'board'):
+            state['board'] = [[None if cell is None else cell.index for cell in row] for row in game.board]
+            state['winner'] = None if game.winner is None else game.winner.index
+        elif hasattr(game, 'winners'):
+            state['hands'] = [None if player.hand is None else player.hand.value for player in game.players]
+
+            if game.is_terminal():
+                state['winners'] = [player.index for player in game.winners]
+                state['losers'] = [player.index for player in game.losers]
+
+        return state
+
+    async def act(self, player_index, action_name, *args):
+        """Applies the action of the player to the game of this session and pushes the new state to the subscribers.
+
+        :param player_index: The index of the acting player.
+        :param action_name: The name of the action.
+        :param args: The arguments of the action.
+        :return: The new state of this session.
+        """
+        if self._closed:
+            raise ValueError(f'The session {self._id!r} is closed')
+        elif action_name not in ACTIONS:
+            raise ValueError(f'Unknown action {action_name!r}')
+        elif not 0 <= player_index < len(self._game.players):
+            raise IndexError('The player index is out of range')
+
+        player = self._game.players[player_index]
+
+        if not hasattr(player, action_name):
+            raise ValueError(f'The {self._game_name} game does not support the action {action_name!r}')
+
+        async with self._lock:
+            if self._closed:
+                raise ValueError(f'The session {self._id!r} is closed')
+
+            ACTIONS[action_name](player, *args)
+            self._version += 1
+            state = self.state
+
+            for queue in self._subscribers:
+                queue.put_nowait(state)
+
+        return state
+
+    async def subscribe(self):
+        """Subscribes to the states of this session.
+
+        The current state is yielded first, followed by the state after each action. The iteration stops after a
+        terminal state or when this session is closed.
+
+        :return: An asynchronous generator of the states of this session.
+        """
+        if self._closed:
+            return
+
+        queue = Queue()
+        queue.put_nowait(self.state)
+        self._subscribers.append(queue)
+
+        try:
+            while True:
+                state = await queue.get()
+
+                if state is None:
+                    break
+
+                yield state
+
+                if state['terminal']:
+                    break
+        finally:
+            self._subscribers.remove(queue)
+
+    def close(self):
+        """Closes this session.
+
+        Actions can no longer be applied to a closed session, and the subscriptions to it are ended.
+
+        :return: None.
+        """
+        self._closed = True
+
+        for queue in self._subscribers:
+            queue.put_nowait(None)
+
+
+class SessionManager:
+    """SessionManager is the class for managers of game sessions.
+
+    :param game_types: The optional game factories (or game registry) keyed by the game names. If it is None,
+                       :data:`GAME_TYPES` is used. The games of other packages can be opted into with a registry that
+                       discovers them from entry points.
+    :param argument_limits: The optional upper bounds of the integer arguments of the game factories keyed by the game
+                            names. If it is None, :data:`ARGUMENT_LIMITS` is used.
+    """
+
+    def __init__(self, game_types=None, argument_limits=None):
+        self._game_types = GAME_TYPES if game_types is None else game_types
+        self._argument_limits = ARGUMENT_LIMITS if argument_limits is None else argument_limits
+        self._sessions = {}
+        self._ids = count()
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def create(self, game_name, *args):
+        """Creates a session of the game type.
+
+        The arguments must be integers within the argument limits of the game type, so that clients cannot create
+        arbitrarily large games.
+
+        :param game_name: The name of the game type.
+        :param args: The arguments of the game factory.
+        :return: The created session.
+        """
+        if game_name not in self._game_types:
+            raise ValueError(f'Unknown game {game_name!r}')
+
+        limits = self._argument_limits.get(game_name, ())
+
+        if len(args) > len(limits):
+            raise TypeError(f'The {game_name} game accepts at most {len(limits)} arguments')
+
+        for arg, limit in zip(args, limits):
+            if not isinstance(arg, int) or isinstance(arg, bool):
+                raise TypeError('The arguments must be of type integer')
+            elif arg > limit:
+                raise ValueError(f'The arguments of the {game_name} game must not exceed {limits}')
+
+        session = Session(next(self._ids), game_name, self._game_types[game_name](*args))
+        self._sessions[session.id] = session
+
+        return session
+
+    def get(self, session_id):
+        """Returns the session with the id.
+
+        :param session_id: The id of the session.
+        :return: The session with the id.
+        """
+        try:
+            return self._sessions[session_id]
+        except KeyError:
+            raise ValueError(f'Unknown session {session_id!r}') from None
+
+    def close(self, session_id):
+        """Closes and removes the session with the id.
+
+        :param session_id: The id of the session.
+        :return: None.
+        """
+        self.get(session_id).close()
+        del self._sessions[session_id]
+
+    async def act(self, session_id, player_index, action_name, *args):
+        """Routes the action to the session with the id.
+
+        :param session_id: The id of the session.
+        :param player_index: The index of the acting player.
+        :param action_name: The name of the action.
+        :param args: The arguments of the action.
+        :return: The new state of the session.
+        """
+        return await self.get(session_id).act(player_index, action_name, *args)
+
+    async def handle(self, message):
+        """Handles the request message.
+
+        The message must have a 'type' of 'create' (with 'game' and optional 'args'), 'state' (with 'session'), 'act'
+        (with 'session', 'player', 'action', and optional 'args'), or 'close' (with 'session').
+
+        :param message: The request message.
+        :return: The response message, whose 'ok' entry denotes whether or not the request succeeded.
+        """
+        try:
+            message_type = message['type']
+
+            if message_type == 'create':
+                state = self.create(message['game'], *message.get('args', ())).state
+            elif message_type == 'state':
+                state = self.get(message['session']).state
+            elif message_type == 'act':
+                state = await self.act(message['session'], message['player'], message['action'],
+                                       *message.get('args', ()))
+            elif message_type == 'close':
+                self.close(message['session'])
+                state = None
+            else:
+                raise ValueError(f'Unknown message type {message_type!r}')
+        except (KeyError, IndexError, TypeError, ValueError) as error:
+            return {'ok': False, 'error': f'{type(error).__name__}: {error}'}
+        else:
+            return {'ok': True, 'state': state}
+
+
+class LoopbackTransport:
+    """LoopbackTransport is the class for in-process transports to session managers.
+
+    Requests and responses are serialized as JSON and passed through queues, as they would be over a network.
+
+    :param manager: The session manager to connect to.
+    """
+
+    def __init__(self, manager):
+        self._manager = manager
+        self._requests = Queue()
+        self._tasks = set()
+
+    async def __aenter__(self):
+        self._spawn(self._serve())
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        for task in tuple(self._tasks):
+            task.cancel()
+
+    async def request(self, message):
+        """Sends the request message and waits for the response.
+
+        :param message: The request message.
+        :return: The response message.
+        """
+        response = Queue(1)
+        await self._requests.put((json.dumps(message), response))
+
+        return json.loads(await response.get())
+
+    async def subscribe(self, session_id):
+        """Subscribes to the states of the session.
+
+        :param session_id: The id of the session.
+        :return: An asynchronous generator of the states of the session.
+        """
+        async for state in self._manager.get(session_id).subscribe():
+            yield json.loads(json.dumps(state))
+
+    async def _serve(self):
+        while True:
+            message, response = await self._requests.get()
+            self._spawn(self._respond(json.loads(message), response))
+
+    async def _respond(self, message, response):
+        try:
+            response.put_nowait(json.dumps(await self._manager.handle(message)))
+        except Exception as error:
+            response.put_nowait(json.dumps({'ok': False, 'error': f'{type(error).__name__}: {error}'}))
+
+    def _spawn(self, coroutine):
+        task = ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
@@ -0,0 +1,92 @@
+"""This module defines the abstract base classes for all elements of simultaneous games in GameFrame.
+
+All elements of simultaneous games in GameFrame should inherit from the classes defined here.
+"""
+from abc import ABC, abstractmethod
+
+from gameframe.exceptions import GameFrameError
+from gameframe.game import Actor, Game, _Action
+
+
+class SimultaneousGame(Game, ABC):
+    """SimultaneousGame is the abstract base class for all simultaneous games.
+
+    In simultaneous games, any number of players can act at the same time. The actions of many players can be applied
+    together as a joint action, which verifies all of the actions before applying any of them, so either all or none of
+    them are applied. A joint action without any actions is a no-op, even if the game is terminal.
+
+    :param nature: The nature of this game.
+    :param players: The players of this game.
+    :param rng: The optional seed or random number generator of this game.
+    """
+
+    __slots__ = ()
+
+    @property
+    def actors(self):
+        """Returns the players of this simultaneous game that are in turn to act.
+
+        :return: A tuple of the players that are in turn to act.
+        """
+        return tuple(player for player in self._players if player.is_actor())
+
+    def is_terminal(self):
+        return not any(player.is_actor() for player in self._players)
+
+    def _act(self, actions, checked=True):
+        actions = tuple(actions)
+
+        if actions:
+            _JointAction(actions, self._nature).act(checked)
+
+
+class SimultaneousActor(Actor):
+    """SimultaneousActor is the class for simultaneous actors.
+
+    Simultaneous actors can act whenever they are in turn to act, regardless of the other actors.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def is_actor(self):
+        """Returns whether or not if this actor is in turn to act.
+
+        :return: True if this actor is in turn to act, else False.
+        """
+        ...
+
+
+class _SimultaneousAction(_Action, ABC):
+    __slots__ = ()
+
+    def verify(self):
+        super().verify()
+
+        if not self.actor.is_actor():
+            raise GameFrameError('The actor must be in turn to act')
+
+
+class _JointAction(_Action):
+    __slots__ = 'actions',
+
+    def __init__(self, actions, actor):
+        super().__init__(actor)
+
+        self.actions = tuple(actions)
+
+    def verify(self):
+        self._verify_actors()
+
+        for action in self.actions:
+            action.verify()
+
+    def _verify_actors(self):
+        super().verify()
+
+        if len({action.actor for action in self.actions}) != len(self.actions):
+            raise GameFrameError('Each actor can only act once in a joint action')
+
+    def apply(self):
+        for action in self.actions:
+            action.apply()
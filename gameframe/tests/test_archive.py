@@ -0,0 +1,119 @@
+from os import path
+from random import randint
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+import numpy as np
+
+from gameframe.archive import ArchiveWriter, load_archive
+from gameframe.games.rockpaperscissors import RockPaperScissorsGame, RockPaperScissorsHand
+from gameframe.games.tictactoe import TicTacToeGame
+
+
+class ArchiveTestCase(TestCase):
+    def test_round_trip(self):
+        games = []
+
+        for _ in range(1000):
+            if randint(0, 1):
+                game = TicTacToeGame()
+
+                for _ in range(randint(0, 9)):
+                    if not game.is_terminal():
+                        game.actor.mark()
+            else:
+                game = RockPaperScissorsGame(randint(2, 3))
+
+                for player in game.players:
+                    if randint(0, 3):
+                        player.throw()
+
+            games.append(game)
+
+        with TemporaryDirectory() as directory:
+            with ArchiveWriter(directory, 64) as writer:
+                writer.write(*games)
+
+            archive = load_archive(directory)
+            tic_tac_toe_games = [game for game in games if isinstance(game, TicTacToeGame)]
+            table = archive['tictactoe']
+
+            self.assertIsInstance(table['moves'], np.memmap)
+            self.assertEqual(len(table['moves']), len(tic_tac_toe_games))
+
+            for game, moves, move_count, winner in zip(
+                    tic_tac_toe_games, table['moves'], table['move_counts'], table['winners'],
+            ):
+                self.assertEqual(move_count, len(game._actions))
+                self.assertSequenceEqual(
+                    moves[:move_count].tolist(), [3 * action.r + action.c for action in game._actions],
+                )
+                self.assertTrue((moves[move_count:] == -1).all())
+                self.assertEqual(winner, -1 if game.winner is None else game.winner.index)
+
+            for player_count in (2, 3):
+                rock_paper_scissors_games = [
+                    game for game in games
+                    if isinstance(game, RockPaperScissorsGame) and len(game.players) == player_count
+                ]
+                table = archive[f'rockpaperscissors{player_count}']
+
+                self.assertEqual(table['hands'].shape, (len(rock_paper_scissors_games), player_count))
+
+                for game, hands, winning_hand in zip(rock_paper_scissors_games, table['hands'], table['winning_hands']):
+                    self.assertSequenceEqual(
+                        hands.tolist(), [-1 if player.hand is None else player.hand.index for player in game.players],
+                    )
+                    self.assertEqual(winning_hand, -1 if game.winning_hand is None else game.winning_hand.index)
+
+    def test_queries(self):
+        with TemporaryDirectory() as directory:
+            with ArchiveWriter(directory) as writer:
+                writer.write(
+                    TicTacToeGame().mark((1, 1), (0, 0), (0, 1), (2, 2), (2, 1)),
+                    TicTacToeGame().mark((1, 1), (0, 1), (0, 0), (2, 2), (0, 2), (2, 0), (1, 0), (1, 2), (2, 1)),
+                    TicTacToeGame().mark((0, 0), (1, 0), (0, 1), (1, 1), (0, 2)),
+                    RockPaperScissorsGame().throw(RockPaperScissorsHand.ROCK, RockPaperScissorsHand.PAPER),
+                )
+
+            table = load_archive(directory)['tictactoe']
+            center_openings = table['moves'][:, 0] == 4
+
+            self.assertEqual(np.count_nonzero(center_openings & (table['winners'] == 0)), 1)
+            self.assertSequenceEqual(np.bincount(table['winners'] + 1, minlength=3).tolist(), [1, 2, 0])
+            self.assertSequenceEqual(load_archive(directory)['rockpaperscissors2']['winning_hands'].tolist(), [1])
+            self.assertRaises(ValueError, table['winners'].__setitem__, 0, 1)
+            self.assertRaises(TypeError, ArchiveWriter(path.join(directory, 'other')).write, object())
+
+    def test_append(self):
+        with TemporaryDirectory() as directory:
+            for i in range(3):
+                with ArchiveWriter(directory, 2) as writer:
+                    writer.write(*(TicTacToeGame().mark((1, 1), (0, 0)) for _ in range(i + 1)))
+
+                    if i:
+                        writer.write(RockPaperScissorsGame().throw(RockPaperScissorsHand.ROCK, None))
+
+            archive = load_archive(directory)
+
+            self.assertEqual(archive['tictactoe']['moves'].shape, (6, 9))
+            self.assertSequenceEqual(archive['tictactoe']['move_counts'].tolist(), [2] * 6)
+            self.assertSequenceEqual(archive['rockpaperscissors2']['hands'][:, 0].tolist(), [0, 0])
+
+            for name in ('moves', 'move_counts', 'winners'):
+                array = np.load(path.join(directory, 'tictactoe', f'{name}.npy'))
+
+                self.assertEqual(len(array), 6)
+                self.assertTrue((array == archive['tictactoe'][name]).all())
+
+            np.save(path.join(directory, 'tictactoe', 'winners.npy'), np.zeros(6))
+
+            self.assertRaises(ValueError, ArchiveWriter(directory).write, TicTacToeGame())
+
+            np.save(path.join(directory, 'tictactoe', 'winners.npy'), np.zeros(5, np.int8))
+
+            self.assertRaises(ValueError, ArchiveWriter(directory).write, TicTacToeGame())
+
+
+if __name__ == '__main__':
+    main()
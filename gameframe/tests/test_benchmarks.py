@@ -0,0 +1,24 @@
+import json
+from unittest import TestCase, main
+
+from gameframe.benchmarks import BENCHMARKS, compare, run_benchmarks
+
+
+class BenchmarksTestCase(TestCase):
+    def test_run_benchmarks(self):
+        results = json.loads(json.dumps(run_benchmarks(duration=0.001, repeat_count=1)))
+
+        self.assertSequenceEqual(tuple(results['results']), tuple(BENCHMARKS))
+        self.assertTrue(all(speed > 0 for speed in results['results'].values()))
+        self.assertDictEqual(compare(results, results), {})
+
+    def test_compare(self):
+        baseline = {'results': {'a': 100, 'b': 100, 'c': 100}}
+        results = {'results': {'a': 95, 'b': 80, 'd': 10}}
+
+        self.assertDictEqual(compare(results, baseline), {'b': 0.8})
+        self.assertDictEqual(compare(results, baseline, 0.01), {'a': 0.95, 'b': 0.8})
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+from random import choice, randint
+from unittest import TestCase, main
+
+from gameframe.exceptions import GameFrameError
+from gameframe.games.mnk import MNKGame
+from gameframe.games.tictactoe import TicTacToeGame
+from gameframe.tests import GameFrameTestCaseMixin
+
+
+class MNKTestCase(GameFrameTestCaseMixin, TestCase):
+    def test_gomoku(self):
+        game = MNKGame(15, 15, 5).mark((7, 7), (0, 0), (8, 8), (0, 1), (9, 9), (0, 2), (10, 10), (0, 3))
+
+        self.assertIsNone(game.winner)
+        self.assertIs(game.mark((6, 6)).winner, game.players[0])
+        self.assertIs(game.loser, game.players[1])
+        self.assertTrue(game.is_terminal())
+        self.assertIsNone(game.undo().winner)
+        self.assertIs(game.mark((11, 11)).winner, game.players[0])
+
+        game = MNKGame(19, 19, 5).mark((0, 18), (18, 0), (1, 17), (18, 1), (2, 16), (18, 2), (3, 15), (18, 3), (5, 13))
+
+        self.assertIsNone(game.winner)
+        self.assertIs(game.mark((18, 4)).winner, game.players[1])
+
+    def test_tic_tac_toe(self):
+        for _ in range(1000):
+            game = MNKGame()
+            tic_tac_toe_game = TicTacToeGame()
+
+            while not game.is_terminal():
+                r, c = choice(tuple(game.empty_cell_locations))
+
+                game.mark((r, c))
+                tic_tac_toe_game.mark((r, c))
+
+                self.assertEqual(game.is_terminal(), tic_tac_toe_game.is_terminal())
+                self.assertEqual(
+                    None if game.winner is None else game.winner.index,
+                    None if tic_tac_toe_game.winner is None else tic_tac_toe_game.winner.index,
+                )
+
+    def test_reset(self):
+        game = MNKGame(15, 15, 5)
+
+        while not game.is_terminal():
+            game.actor.mark()
+
+        game.reset()
+
+        self.assertIs(game.actor, game.players[0])
+        self.assertIsNone(game.winner)
+        self.assertCountEqual(tuple(game.empty_cell_locations), tuple((r, c) for r in range(15) for c in range(15)))
+        self.assertTrue(all(cell is None for row in game.board for cell in row))
+
+    def test_illegal_actions(self):
+        self.assertRaises(GameFrameError, MNKGame(15, 15, 5).mark((0, 0)).mark, (0, 0))
+        self.assertRaises(GameFrameError, MNKGame(15, 15, 5).mark, (15, 0))
+        self.assertRaises(GameFrameError, MNKGame(15, 15, 5).mark((0, 0)).players[0].mark, 0, 1)
+        self.assertRaises(ValueError, MNKGame, 0, 3, 3)
+
+    def create_game(self):
+        return MNKGame(*choice(((3, 3, 3), (4, 4, 3), (15, 15, 5), (19, 19, 5))))
+
+    def act(self, game):
+        if randint(0, 9):
+            game.actor.mark()
+        else:
+            game.undo() if game._actions else game.actor.mark()
+
+    def verify(self, game):
+        self.assertCountEqual(
+            tuple(game.empty_cell_locations),
+            tuple((r, c) for r in range(game.m) for c in range(game.n) if game.board[r][c] is None),
+        )
+
+        if game.is_terminal():
+            self.assertTrue(not tuple(game.empty_cell_locations) or game.winner is not None)
+
+            for player in game.players:
+                self.assertFalse(player.can_mark())
+                self.assertFalse(tuple(player.markable_cell_locations))
+        else:
+            self.assertIsNone(game.winner)
+
+            actor = game.actor
+            non_actor = next(actor)
+
+            self.assertTrue(actor.can_mark())
+            self.assertFalse(non_actor.can_mark())
+            self.assertCountEqual(tuple(actor.markable_cell_locations), tuple(game.empty_cell_locations))
+
+            for r, c in game.empty_cell_locations:
+                self.assertTrue(actor.can_mark(r, c))
+                self.assertFalse(non_actor.can_mark(r, c))
+
+
+if __name__ == '__main__':
+    main()
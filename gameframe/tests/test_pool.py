@@ -0,0 +1,32 @@
+from unittest import TestCase, main
+
+from gameframe.games.tictactoe import TicTacToeGame
+from gameframe.pool import GamePool
+
+
+class GamePoolTestCase(TestCase):
+    def test_reuse(self):
+        pool = GamePool(TicTacToeGame, 1)
+        game = pool.acquire()
+
+        while not game.is_terminal():
+            game.actor.mark()
+
+        pool.release(game)
+
+        self.assertEqual(len(pool), 1)
+
+        with pool.game() as reused_game:
+            self.assertIs(reused_game, game)
+            self.assertFalse(reused_game.is_terminal())
+            self.assertEqual(len(tuple(reused_game.empty_cell_locations)), 9)
+            self.assertEqual(len(pool), 0)
+
+            pool.release(pool.acquire())
+
+        self.assertEqual(len(pool), 1)
+        self.assertIsNot(pool.acquire(), pool.acquire())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+from unittest import TestCase, main
+
+from gameframe import profiling
+from gameframe.exceptions import GameFrameError
+from gameframe.game import _Action
+from gameframe.games.rockpaperscissors import RockPaperScissorsGame, RockPaperScissorsHand, _ThrowAction
+from gameframe.games.tictactoe import TicTacToeGame
+
+
+class ProfilingTestCase(TestCase):
+    def setUp(self):
+        profiling.reset()
+
+    def test_statistics(self):
+        act = _Action.act
+
+        with profiling.profile():
+            self.assertTrue(profiling.is_enabled())
+
+            TicTacToeGame().mark((1, 1), (0, 0), (2, 2))
+            self.assertRaises(GameFrameError, TicTacToeGame().mark((1, 1)).mark, (1, 1))
+
+            game = RockPaperScissorsGame().throw(RockPaperScissorsHand.ROCK, RockPaperScissorsHand.PAPER)
+
+            self.assertFalse(game.players[0].can_throw(0))
+            self.assertRaises(TypeError, RockPaperScissorsGame().players[0].can_throw, 0)
+
+        self.assertFalse(profiling.is_enabled())
+        self.assertIs(_Action.act, act)
+
+        TicTacToeGame().mark((1, 1))
+
+        statistics = profiling.get_statistics()
+        mark_statistics = statistics['gameframe.games.tictactoe._MarkAction']
+        throw_statistics = statistics['gameframe.games.rockpaperscissors._ThrowAction']
+
+        self.assertEqual(mark_statistics['act_count'], 5)
+        self.assertEqual(mark_statistics['rejected_act_count'], 1)
+        self.assertGreater(mark_statistics['verify_time'], 0)
+        self.assertGreater(mark_statistics['apply_time'], 0)
+        self.assertEqual(throw_statistics['act_count'], 2)
+        self.assertGreater(throw_statistics['apply_time'], 0)
+        self.assertNotIn('gameframe.simultaneous._JointAction', statistics)
+        self.assertEqual(throw_statistics['check_count'], 2)
+        self.assertEqual(throw_statistics['rejected_check_count'], 1)
+
+        profiling.reset()
+
+        self.assertDictEqual(profiling.get_statistics(), {})
+
+    def test_joint_actions(self):
+        game = RockPaperScissorsGame(3)
+
+        with profiling.profile():
+            self.assertRaises(GameFrameError, game._act, (
+                _ThrowAction(RockPaperScissorsHand.ROCK, game.players[0]),
+                _ThrowAction(RockPaperScissorsHand.PAPER, game.players[0]),
+            ))
+            game.throw(RockPaperScissorsHand.ROCK, RockPaperScissorsHand.PAPER, RockPaperScissorsHand.ROCK)
+
+        throw_statistics = profiling.get_statistics()['gameframe.games.rockpaperscissors._ThrowAction']
+
+        self.assertEqual(throw_statistics['act_count'], 5)
+        self.assertEqual(throw_statistics['rejected_act_count'], 2)
+        self.assertGreater(throw_statistics['verify_time'], 0)
+        self.assertGreater(throw_statistics['apply_time'], 0)
+        self.assertTrue(game.is_terminal())
+
+
+if __name__ == '__main__':
+    main()
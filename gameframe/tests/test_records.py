@@ -0,0 +1,70 @@
+from os import path
+from random import randint
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from gameframe.games.rockpaperscissors import RockPaperScissorsGame, RockPaperScissorsHand
+from gameframe.games.tictactoe import TicTacToeGame
+from gameframe.records import RecordWriter, decode, encode, read_records
+
+
+class RecordsTestCase(TestCase):
+    def test_encode(self):
+        self.assertEqual(encode(TicTacToeGame().mark((1, 1), (0, 0), (2, 2))), bytes((0, 2, 3, 4, 0, 8)))
+        self.assertEqual(
+            encode(RockPaperScissorsGame(5).throw(*map(RockPaperScissorsHand, ('Rock', 'Paper', 'Scissors')))),
+            bytes((1, 5, 2, 0b11100100, 0b11)),
+        )
+        self.assertEqual(len(encode(RockPaperScissorsGame(1000))), 255)
+        self.assertRaises(TypeError, encode, object())
+        self.assertRaises(ValueError, decode, bytes((0, 2, 3, 4, 0)))
+        self.assertRaises(ValueError, decode, bytes((2, 2, 0)))
+
+    def test_round_trip(self):
+        games = []
+
+        for _ in range(1000):
+            if randint(0, 1):
+                game = TicTacToeGame()
+
+                for _ in range(randint(0, 9)):
+                    if not game.is_terminal():
+                        game.actor.mark()
+            else:
+                game = RockPaperScissorsGame(randint(2, 10))
+
+                for player in game.players:
+                    if randint(0, 3):
+                        player.throw()
+
+            games.append(game)
+
+        with TemporaryDirectory() as directory:
+            file_path = path.join(directory, 'games.bin')
+
+            with RecordWriter(file_path) as writer:
+                writer.write(*games[:500])
+
+            with RecordWriter(file_path) as writer:
+                writer.write(*games[500:])
+
+            replayed_games = tuple(read_records(file_path))
+
+        self.assertEqual(len(replayed_games), len(games))
+
+        for game, replayed_game in zip(games, replayed_games):
+            self.assertIs(type(game), type(replayed_game))
+            self.assertEqual(self.get_state(game), self.get_state(replayed_game))
+            self.assertEqual(encode(game), encode(replayed_game))
+            self.assertEqual(encode(decode(encode(game))), encode(game))
+
+    @staticmethod
+    def get_state(game):
+        if isinstance(game, TicTacToeGame):
+            return tuple(tuple(cell and cell.index for cell in row) for row in game.board), game.is_terminal()
+        else:
+            return tuple(player.hand for player in game.players), game.is_terminal()
+
+
+if __name__ == '__main__':
+    main()
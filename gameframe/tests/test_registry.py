@@ -0,0 +1,76 @@
+import sys
+from os import mkdir
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from gameframe.games.mnk import MNKGame
+from gameframe.games.tictactoe import TicTacToeGame
+from gameframe.registry import GAMES, GameRegistry
+
+
+class GameRegistryTestCase(TestCase):
+    def test_default_registry(self):
+        self.assertTrue({'tictactoe', 'rockpaperscissors', 'rockpaperscissorsbatch', 'mnk'} <= set(GAMES))
+        self.assertIs(GAMES['tictactoe'], TicTacToeGame)
+        self.assertIsInstance(GAMES.create('mnk', 4, 4, k=3), MNKGame)
+        self.assertEqual(len(GAMES.create('rockpaperscissors', 5).players), 5)
+        self.assertNotIn('chess', GAMES)
+        self.assertRaises(KeyError, GAMES.__getitem__, 'chess')
+        self.assertRaises(ValueError, GAMES.create, 'chess')
+
+    def test_lazy_loading(self):
+        registry = GameRegistry({'tictactoe': 'gameframe.games.tictactoe:TicTacToeGame'})
+        registry.register('mnk', MNKGame)
+
+        self.assertIsInstance(registry._factories['tictactoe'], str)
+        self.assertSetEqual(set(registry), {'tictactoe', 'mnk'})
+        self.assertIs(registry['tictactoe'], TicTacToeGame)
+        self.assertIs(registry._factories['tictactoe'], TicTacToeGame)
+        self.assertRaises(ValueError, registry.register, 'mnk', MNKGame)
+        self.assertRaises(ValueError, registry.register, 'gomoku', 'gameframe.games.mnk')
+        self.assertRaises(TypeError, registry.register, 'gomoku', None)
+
+        selection = registry.select('mnk')
+
+        self.assertSetEqual(set(selection), {'mnk'})
+        self.assertIs(selection['mnk'], MNKGame)
+        self.assertRaises(ValueError, registry.select, 'chess')
+
+        registry.unregister('mnk')
+
+        self.assertNotIn('mnk', registry)
+        self.assertEqual(len(registry), 1)
+        self.assertRaises(ValueError, registry.unregister, 'mnk')
+
+    def test_entry_points(self):
+        with TemporaryDirectory() as path:
+            mkdir(join(path, 'gameframe_plugin-1.0.dist-info'))
+
+            with open(join(path, 'gameframe_plugin-1.0.dist-info', 'METADATA'), 'w') as file:
+                file.write('Metadata-Version: 2.1\nName: gameframe-plugin\nVersion: 1.0\n')
+
+            with open(join(path, 'gameframe_plugin-1.0.dist-info', 'entry_points.txt'), 'w') as file:
+                file.write('[gameframe.games]\ngomoku = gameframe.games.mnk:MNKGame\ntictactoe = builtins:object\n')
+
+            sys.path.insert(0, path)
+
+            try:
+                registry = GameRegistry({'tictactoe': TicTacToeGame}, 'gameframe.games')
+
+                self.assertIn('gomoku', registry)
+                self.assertEqual(len(registry), 2)
+                self.assertIs(registry['gomoku'], MNKGame)
+                self.assertIs(registry['tictactoe'], TicTacToeGame)
+                self.assertNotIn('gomoku', GameRegistry({'tictactoe': TicTacToeGame}))
+
+                selection = GameRegistry(entry_point_group='gameframe.games').select('gomoku')
+
+                self.assertEqual(selection._factories['gomoku'], 'gameframe.games.mnk:MNKGame')
+                self.assertSetEqual(set(selection), {'gomoku'})
+            finally:
+                sys.path.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,16 @@
+import pickle
+from copy import deepcopy
 from itertools import filterfalse, product
 from random import randint
 from unittest import TestCase, main
 
 from auxiliary import const, next_or_none
 
-from gameframe.games.rockpaperscissors import RockPaperScissorsGame, RockPaperScissorsHand, RockPaperScissorsPlayer
+from gameframe.exceptions import GameFrameError
+from gameframe.games.rockpaperscissors import (
+    RockPaperScissorsGame, RockPaperScissorsHand, RockPaperScissorsPlayer, _ThrowAction,
+)
+from gameframe.simultaneous import SimultaneousActor
 from gameframe.tests import GameFrameTestCaseMixin
 
 
@@ -27,9 +33,13 @@ class RockPaperScissorsTestCase(GameFrameTestCaseMixin, TestCase):
 
         self.assertSequenceEqual(tuple(game.winners), ())
         self.assertSequenceEqual(tuple(game.losers), ())
+        self.assertIsNone(game.winning_hand)
+        self.assertIsNone(game.losing_hand)
 
         game = RockPaperScissorsGame(4).throw(*map(RockPaperScissorsHand, ('Rock', 'Paper', 'Rock', 'Rock')))
 
+        self.assertIs(game.winning_hand, RockPaperScissorsHand.PAPER)
+        self.assertIs(game.losing_hand, RockPaperScissorsHand.ROCK)
         self.assertSequenceEqual(tuple(game.winners), (game.players[1],))
         self.assertSequenceEqual(tuple(game.losers), (game.players[0], *game.players[2:]))
 
@@ -47,6 +57,134 @@ class RockPaperScissorsTestCase(GameFrameTestCaseMixin, TestCase):
         self.assertSequenceEqual(tuple(game.winners), game.players[:2] + game.players[4:])
         self.assertSequenceEqual(tuple(game.losers), game.players[2:4])
 
+    def test_actors(self):
+        game = RockPaperScissorsGame(5)
+
+        self.assertIsNone(game.nature.index)
+        self.assertIs(next(game.nature), game.nature)
+        self.assertTrue(game.nature.is_nature())
+        self.assertFalse(game.nature.is_player())
+
+        for i, player in enumerate(game.players):
+            self.assertEqual(player.index, i)
+            self.assertIs(next(player), game.players[(i + 1) % 5])
+            self.assertFalse(player.is_nature())
+            self.assertTrue(player.is_player())
+
+        clone = game.clone()
+
+        self.assertIs(next(clone.players[4]), clone.players[0])
+        self.assertIs(next(clone.nature), clone.nature)
+
+    def test_clone(self):
+        game = RockPaperScissorsGame(3).throw(RockPaperScissorsHand.ROCK, RockPaperScissorsHand.PAPER)
+        clone = game.clone().throw(RockPaperScissorsHand.PAPER)
+
+        self.assertFalse(game.is_terminal())
+        self.assertIsNone(game.players[2].hand)
+        self.assertSequenceEqual(tuple(clone.winners), clone.players[1:])
+        self.assertSequenceEqual(tuple(clone.losers), clone.players[:1])
+        self.assertSequenceEqual(tuple(game.throw(RockPaperScissorsHand.SCISSORS).winners), ())
+
+    def test_pickle(self):
+        game = RockPaperScissorsGame(3).throw(RockPaperScissorsHand.ROCK)
+
+        for copied_game in (pickle.loads(pickle.dumps(game)), deepcopy(game)):
+            self.assertEqual([player.hand for player in copied_game.players], [RockPaperScissorsHand.ROCK, None, None])
+            self.assertSequenceEqual(copied_game.throw(None, None).actors, ())
+            self.assertTrue(copied_game.is_terminal())
+
+    def test_reset(self):
+        game = RockPaperScissorsGame(3).throw(*map(RockPaperScissorsHand, ('Rock', 'Paper', 'Paper')))
+
+        self.assertIs(game.reset(), game)
+        self.assertFalse(game.is_terminal())
+        self.assertIsNone(game.winners)
+        self.assertTrue(all(player.can_throw() for player in game.players))
+        self.assertSequenceEqual(
+            tuple(game.throw(*map(RockPaperScissorsHand, ('Rock', 'Scissors', 'Rock'))).winners),
+            game.players[::2],
+        )
+
+    def test_rng(self):
+        hands = []
+
+        for rng in (0, 0, 1):
+            game = RockPaperScissorsGame(1000, rng)
+
+            for player in game.players:
+                player.throw()
+
+            hands.append(tuple(player.hand for player in game.players))
+
+        self.assertEqual(hands[0], hands[1])
+        self.assertNotEqual(hands[0], hands[2])
+        self.assertEqual(set(hands[0]), set(RockPaperScissorsHand))
+
+    def test_illegal_actions(self):
+        self.assertRaises(TypeError, RockPaperScissorsGame().players[0].can_throw, 'Rock')
+        self.assertFalse(RockPaperScissorsGame().throw(RockPaperScissorsHand.ROCK).players[0].can_throw())
+
+    def test_abstract_actors(self):
+        class Player(SimultaneousActor):
+            pass
+
+        self.assertRaises(TypeError, Player, RockPaperScissorsGame())
+
+    def test_checked(self):
+        game = RockPaperScissorsGame(3)
+
+        self.assertTrue(game.checked)
+
+        game.throw(RockPaperScissorsHand.ROCK, checked=False)
+        game.players[1].throw(RockPaperScissorsHand.PAPER, checked=False)
+
+        self.assertRaises(GameFrameError, game.players[0].throw, RockPaperScissorsHand.PAPER)
+        self.assertSequenceEqual(game.actors, game.players[2:])
+
+        game.checked = False
+
+        self.assertFalse(game.clone().checked)
+
+        game.throw(RockPaperScissorsHand.ROCK)
+
+        self.assertTrue(game.is_terminal())
+        self.assertIs(game.winning_hand, RockPaperScissorsHand.PAPER)
+
+        game.checked = True
+
+        self.assertRaises(GameFrameError, game.players[2].throw, RockPaperScissorsHand.ROCK)
+
+    def test_joint_actions(self):
+        game = RockPaperScissorsGame(4).throw(RockPaperScissorsHand.ROCK)
+
+        self.assertSequenceEqual(game.actors, game.players[1:])
+        self.assertRaises(TypeError, game.throw, RockPaperScissorsHand.PAPER, 'Rock')
+        self.assertSequenceEqual(game.actors, game.players[1:])
+        self.assertIsNone(game.players[1].hand)
+
+        game.throw(None, RockPaperScissorsHand.PAPER)
+
+        self.assertSequenceEqual(game.actors, game.players[3:])
+        self.assertIs(game.players[2].hand, RockPaperScissorsHand.PAPER)
+        self.assertFalse(game.is_terminal())
+
+        game.throw(RockPaperScissorsHand.SCISSORS, RockPaperScissorsHand.ROCK)
+
+        self.assertSequenceEqual(game.actors, ())
+        self.assertTrue(game.is_terminal())
+        self.assertIs(game.players[3].hand, RockPaperScissorsHand.SCISSORS)
+        self.assertIs(game.throw(), game)
+        self.assertIs(game.throw(RockPaperScissorsHand.PAPER), game)
+        self.assertIs(game.players[0].hand, RockPaperScissorsHand.ROCK)
+        self.assertRaises(GameFrameError, game.players[0].throw, RockPaperScissorsHand.PAPER)
+
+        game = RockPaperScissorsGame()
+        player = game.players[0]
+
+        self.assertRaises(GameFrameError, game._act, (_ThrowAction(None, player), _ThrowAction(None, player)))
+        self.assertIsNone(player.hand)
+
     def create_game(self):
         return RockPaperScissorsGame(randint(2, 5))
 
@@ -77,6 +215,8 @@ class RockPaperScissorsTestCase(GameFrameTestCaseMixin, TestCase):
             self.assertFalse(all(map(RockPaperScissorsPlayer.hand.fget, game.players)))
 
         for player in game.players:
+            self.assertSequenceEqual(player.throwable_hands, tuple(filter(player.can_throw, RockPaperScissorsHand)))
+
             if player.hand is None:
                 self.assertTrue(player.can_throw())
             else:
@@ -0,0 +1,80 @@
+from random import randint
+from unittest import TestCase, main
+
+import numpy as np
+
+from gameframe.exceptions import GameFrameError
+from gameframe.games.rockpaperscissors import RockPaperScissorsGame, RockPaperScissorsHand
+from gameframe.games.rockpaperscissorsbatch import RockPaperScissorsBatch, play_tournament
+
+
+class RockPaperScissorsBatchTestCase(TestCase):
+    def test_consistency(self):
+        for _ in range(100):
+            batch = RockPaperScissorsBatch(100, randint(2, 6)).throw()
+            winners = batch.winners
+            losers = batch.losers
+            winning_hands = batch.winning_hands
+            losing_hands = batch.losing_hands
+
+            for i, hands in enumerate(batch.hands):
+                game = RockPaperScissorsGame(batch.player_count)
+                game.throw(*(tuple(RockPaperScissorsHand)[hand] for hand in hands))
+
+                self.assertSequenceEqual(np.flatnonzero(winners[i]).tolist(), [player.index for player in game.winners])
+                self.assertSequenceEqual(np.flatnonzero(losers[i]).tolist(), [player.index for player in game.losers])
+                self.assertSequenceEqual(batch.winner_indices(i).tolist(), np.flatnonzero(winners[i]).tolist())
+                self.assertSequenceEqual(batch.loser_indices(i).tolist(), np.flatnonzero(losers[i]).tolist())
+                self.assertEqual(winning_hands[i], -1 if game.winning_hand is None else game.winning_hand.index)
+                self.assertEqual(losing_hands[i], -1 if game.losing_hand is None else game.losing_hand.index)
+
+    def test_throw(self):
+        batch = RockPaperScissorsBatch(2, 3)
+
+        self.assertFalse(batch.is_terminal())
+        self.assertIsNone(batch.winners)
+        self.assertIsNone(batch.losers)
+        self.assertRaises(GameFrameError, batch.throw, 3)
+        self.assertRaises(TypeError, batch.throw, 0.5)
+
+        batch.throw([[0, 1, 0], [0, 1, 2]])
+
+        self.assertTrue(batch.is_terminal())
+        self.assertSequenceEqual(batch.winners.tolist(), [[False, True, False], [False, False, False]])
+        self.assertSequenceEqual(batch.losers.tolist(), [[True, False, True], [False, False, False]])
+
+        batch.throw(2)
+
+        self.assertSequenceEqual(batch.hands.tolist(), [[0, 1, 0], [0, 1, 2]])
+        self.assertEqual(
+            RockPaperScissorsBatch(10, rng=0).throw().hands.tolist(),
+            RockPaperScissorsBatch(10, rng=0).throw().hands.tolist(),
+        )
+
+    def test_large_game(self):
+        batch = RockPaperScissorsBatch(1, 1000000)
+
+        self.assertIsNone(batch.winner_indices())
+
+        batch.throw(np.arange(1000000) % 4 // 3)
+
+        self.assertSequenceEqual(batch.winning_hands.tolist(), [1])
+        self.assertSequenceEqual(batch.losing_hands.tolist(), [0])
+        self.assertSequenceEqual(batch.winner_indices().tolist(), range(3, 1000000, 4))
+        self.assertEqual(batch.loser_indices().size, 750000)
+
+    def test_tournament(self):
+        for player_count in (2, 3, 5, 64, 1000):
+            rounds = play_tournament(player_count)
+            round_count = (player_count - 1).bit_length()
+
+            self.assertEqual(rounds.max(), round_count)
+            self.assertEqual((rounds == round_count).sum(), 1)
+            self.assertEqual((rounds == 0).sum(), player_count // 2)
+
+        self.assertSequenceEqual(play_tournament(100, 0).tolist(), play_tournament(100, 0).tolist())
+        self.assertRaises(ValueError, play_tournament, 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+from itertools import product
+from unittest import TestCase, main
+
+import numpy as np
+
+from gameframe.games.rockpaperscissors import RockPaperScissorsGame, RockPaperScissorsHand
+from gameframe.games.rockpaperscissorstrainer import RockPaperScissorsTrainer, get_payoff_matrix
+
+
+class RockPaperScissorsTrainerTestCase(TestCase):
+    def test_payoff_matrix(self):
+        self.assertSequenceEqual(get_payoff_matrix().tolist(), [[0, -1, 1], [1, 0, -1], [-1, 1, 0]])
+        self.assertRaises(ValueError, RockPaperScissorsTrainer, 2, np.eye(2))
+        self.assertRaises(ValueError, RockPaperScissorsTrainer, 1)
+
+    def test_utilities(self):
+        for player_count in range(2, 5):
+            trainer = RockPaperScissorsTrainer(player_count)
+            strategies = np.random.dirichlet(np.ones(3), player_count)
+            utilities = np.zeros((player_count, 3))
+
+            for hands in product(range(3), repeat=player_count):
+                game = RockPaperScissorsGame(player_count).throw(*(tuple(RockPaperScissorsHand)[i] for i in hands))
+                payoffs = np.zeros(player_count)
+                payoffs[[player.index for player in game.winners]] = 1
+                payoffs[[player.index for player in game.losers]] = -1
+
+                for i in range(player_count):
+                    probability = np.prod([strategies[j, hand] for j, hand in enumerate(hands) if j != i])
+                    utilities[i, hands[i]] += probability * payoffs[i]
+
+            np.testing.assert_allclose(trainer.utilities(strategies), utilities, atol=1e-12)
+
+        self.assertRaises(ValueError, RockPaperScissorsTrainer().utilities, [[1, 0, 0], [0.5, 0.6, 0]])
+
+    def test_equilibrium(self):
+        trainer = RockPaperScissorsTrainer()
+
+        np.testing.assert_allclose(trainer.train(100).average_strategies, np.full((2, 3), 1 / 3))
+        self.assertAlmostEqual(trainer.exploitability(), 0)
+        self.assertEqual(trainer.iteration_count, 100)
+
+        payoff_matrix = get_payoff_matrix()
+        payoff_matrix[0, 2] = 2
+        payoff_matrix[2, 0] = -2
+
+        for plus in (False, True):
+            trainer = RockPaperScissorsTrainer(payoff_matrix=payoff_matrix, plus=plus).train(5000)
+
+            np.testing.assert_allclose(trainer.average_strategies, [[0.25, 0.5, 0.25]] * 2, atol=0.02)
+            self.assertLess(trainer.exploitability(), 0.02)
+            self.assertGreater(trainer.exploitability([[1, 0, 0], [1, 0, 0]]), 0.5)
+
+        self.assertGreater(RockPaperScissorsTrainer(1000000).train(1).iteration_count, 0)
+        self.assertRaises(ValueError, trainer.train)
+
+    def test_exploitation(self):
+        trainer = RockPaperScissorsTrainer(3, fixed_strategies={1: [0.5, 0.25, 0.25], 2: [0.5, 0.25, 0.25]})
+        trainer.train(1000)
+
+        self.assertSequenceEqual(trainer.average_strategies[1:].tolist(), [[0.5, 0.25, 0.25]] * 2)
+        self.assertEqual(trainer.best_responses()[0], 1)
+        self.assertGreater(trainer.average_strategies[0, 1], 0.9)
+        self.assertGreater(trainer.train(duration=0.01).iteration_count, 1000)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+from unittest import TestCase, main
+
+from gameframe.games.mnk import MNKGame
+from gameframe.games.rockpaperscissors import RockPaperScissorsGame, RockPaperScissorsHand
+from gameframe.games.rockpaperscissorsbatch import RockPaperScissorsBatch
+from gameframe.games.tictactoe import TicTacToeGame
+from gameframe.games.tictactoetable import TicTacToeTable
+from gameframe.rollout import rollout
+
+
+class RolloutTestCase(TestCase):
+    def test_random_policy(self):
+        for game in (TicTacToeGame(0), MNKGame(4, 4, 3, 0), RockPaperScissorsGame(3, 0)):
+            self.assertIs(rollout(game), game)
+            self.assertTrue(game.is_terminal())
+            self.assertTrue(game.checked)
+
+        boards = [rollout(TicTacToeGame(0)).board for _ in range(2)]
+
+        self.assertEqual(*(tuple(tuple(cell and cell.index for cell in row) for row in board) for board in boards))
+
+    def test_policy(self):
+        with TicTacToeTable() as table:
+            for r in range(3):
+                for c in range(3):
+                    game = rollout(TicTacToeGame().mark((r, c)), lambda game, actor: table.best_move(game))
+
+                    self.assertTrue(game.is_terminal())
+                    self.assertIsNone(game.winner)
+
+        game = rollout(
+            RockPaperScissorsGame(3),
+            lambda game, actor: RockPaperScissorsHand.PAPER if actor.index % 2 else RockPaperScissorsHand.ROCK,
+        )
+
+        self.assertSequenceEqual(
+            [player.hand for player in game.players],
+            (RockPaperScissorsHand.ROCK, RockPaperScissorsHand.PAPER, RockPaperScissorsHand.ROCK),
+        )
+        self.assertIs(game.winning_hand, RockPaperScissorsHand.PAPER)
+
+        self.assertRaises(TypeError, rollout, RockPaperScissorsBatch(10))
+
+
+if __name__ == '__main__':
+    main()
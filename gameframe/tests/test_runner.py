@@ -0,0 +1,46 @@
+from unittest import TestCase, main
+
+from gameframe.games.rockpaperscissors import RockPaperScissorsGame, RockPaperScissorsPlayer
+from gameframe.games.tictactoe import TicTacToeGame
+from gameframe.runner import run
+
+
+def act_tic_tac_toe(game):
+    game.actor.mark()
+
+
+def get_tic_tac_toe_outcome(game):
+    return None if game.winner is None else game.winner.index
+
+
+def act_rock_paper_scissors(game):
+    next(filter(RockPaperScissorsPlayer.can_throw, game.players)).throw()
+
+
+def get_rock_paper_scissors_outcome(game):
+    return len(tuple(game.winners))
+
+
+class RunnerTestCase(TestCase):
+    def test_tic_tac_toe(self):
+        result = run(TicTacToeGame, act_tic_tac_toe, 1000, get_tic_tac_toe_outcome, 2, seed=0)
+
+        self.assertEqual(result.game_count, 1000)
+        self.assertEqual(sum(result.outcomes.values()), 1000)
+        self.assertLessEqual(set(result.outcomes), {None, 0, 1})
+        self.assertGreater(result.outcomes[0], result.outcomes[1])
+        self.assertGreater(result.speed, 0)
+
+    def test_reproducibility(self):
+        results = (
+            run(RockPaperScissorsGame, act_rock_paper_scissors, 500, get_rock_paper_scissors_outcome, 1, 50, 1),
+            run(RockPaperScissorsGame, act_rock_paper_scissors, 500, get_rock_paper_scissors_outcome, 3, 50, 1),
+        )
+
+        self.assertEqual(results[0].outcomes, results[1].outcomes)
+        self.assertEqual(sum(results[0].outcomes.values()), 500)
+        self.assertEqual(run(TicTacToeGame, act_tic_tac_toe, 10, process_count=1).outcomes, {None: 10})
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+from unittest import TestCase, main
+
+from gameframe.games.tictactoe import TicTacToeGame
+from gameframe.search import MonteCarloTreeSearch
+
+
+class MonteCarloTreeSearchTestCase(TestCase):
+    def test_tic_tac_toe(self):
+        search = self.create_search(TicTacToeGame().mark((0, 0), (1, 0), (0, 1), (1, 1)))
+
+        self.assertEqual(search.search(1000).best_move(), (0, 2))
+
+        search = self.create_search(TicTacToeGame().mark((0, 0), (1, 1), (0, 1)))
+
+        self.assertEqual(search.search(2000).best_move(), (0, 2))
+
+    def test_self_play(self):
+        game = TicTacToeGame()
+        search = self.create_search(game)
+
+        while not search.game.is_terminal():
+            move = search.search(500).best_move()
+            visit_count = sum(visits for _, visits, _ in search.statistics())
+
+            search.advance(move)
+            game.mark(move)
+
+            self.assertLessEqual(sum(visits for _, visits, _ in search.statistics()), visit_count)
+
+        self.assertIsNone(game.winner)
+        self.assertIsNone(search.best_move())
+
+    def test_budgets(self):
+        search = self.create_search(TicTacToeGame())
+
+        self.assertRaises(ValueError, search.search)
+        self.assertEqual(sum(visits for _, visits, _ in search.search(100).statistics()), 100)
+
+        node_count = search.node_count
+
+        self.assertGreater(search.search(duration=0.1).node_count, node_count)
+        self.assertGreater(sum(visits for _, visits, _ in search.statistics()), 100)
+
+    @staticmethod
+    def create_search(game):
+        return MonteCarloTreeSearch(
+            game,
+            lambda game: game.empty_cell_locations,
+            lambda game, move: game.actor.mark(*move),
+            lambda game: (0, 0) if game.winner is None else (1, -1) if game.winner is game.players[0] else (-1, 1),
+            rng=0,
+        )
+
+
+if __name__ == '__main__':
+    main()
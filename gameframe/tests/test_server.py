@@ -0,0 +1,143 @@
+from asyncio import gather, run, sleep, wait_for
+from unittest import TestCase, main
+
+from gameframe.server import GAME_TYPES, LoopbackTransport, SessionManager
+
+
+class ServerTestCase(TestCase):
+    def test_tic_tac_toe(self):
+        async def play():
+            manager = SessionManager()
+
+            async with LoopbackTransport(manager) as transport:
+                response = await transport.request({'type': 'create', 'game': 'tictactoe'})
+                session_id = response['state']['session']
+                states = []
+
+                async def watch():
+                    async for state in transport.subscribe(session_id):
+                        states.append(state)
+
+                watcher = gather(watch())
+
+                for player, r, c in ((0, 0, 0), (1, 1, 0), (0, 0, 1), (1, 1, 1), (0, 0, 2)):
+                    response = await transport.request({
+                        'type': 'act', 'session': session_id, 'player': player, 'action': 'mark', 'args': [r, c],
+                    })
+
+                    self.assertTrue(response['ok'])
+
+                await watcher
+
+                return response, states
+
+        response, states = run(play())
+
+        self.assertEqual(response['state']['winner'], 0)
+        self.assertTrue(response['state']['terminal'])
+        self.assertEqual(response['state']['board'], [[0, 0, 0], [1, 1, None], [None, None, None]])
+        self.assertEqual([state['version'] for state in states], list(range(6)))
+        self.assertEqual(states[-1], response['state'])
+
+    def test_errors(self):
+        async def play():
+            manager = SessionManager()
+
+            async with LoopbackTransport(manager) as transport:
+                session_id = (await transport.request({'type': 'create', 'game': 'rockpaperscissors', 'args': [3]}))[
+                    'state']['session']
+
+                return await gather(
+                    transport.request({'type': 'create', 'game': 'chess'}),
+                    transport.request({'type': 'act', 'session': 100, 'player': 0, 'action': 'throw'}),
+                    transport.request({'type': 'act', 'session': session_id, 'player': 3, 'action': 'throw'}),
+                    transport.request({'type': 'act', 'session': session_id, 'player': 0, 'action': 'mark'}),
+                    transport.request({
+                        'type': 'act', 'session': session_id, 'player': 0, 'action': 'throw', 'args': ['Rock'],
+                    }),
+                    transport.request({
+                        'type': 'act', 'session': session_id, 'player': 0, 'action': 'throw', 'args': ['Paper'],
+                    }),
+                    transport.request({'type': 'unknown'}),
+                    transport.request({'type': 'create', 'game': 'mnk', 'args': [100000, 100000, 5]}),
+                    transport.request({'type': 'create', 'game': 'mnk', 'args': [5, 5, 4, 0]}),
+                    transport.request({'type': 'create', 'game': 'mnk', 'args': [5, 5, '4']}),
+                    transport.request({'type': 'create', 'game': 'rockpaperscissors', 'args': [10 ** 9]}),
+                    transport.request({'type': 'create', 'game': 'tictactoe', 'args': [0]}),
+                    transport.request({'type': 'create', 'game': 'mnk', 'args': [100, 100, 5]}),
+                )
+
+        responses = run(play())
+
+        self.assertEqual(
+            [response['ok'] for response in responses],
+            [False, False, False, False, True, False, False, False, False, False, False, False, True],
+        )
+        self.assertEqual(responses[4]['state']['hands'], ['Rock', None, None])
+        self.assertEqual(responses[4]['state']['actors'], [1, 2])
+        self.assertIn('GameFrameError', responses[5]['error'])
+
+    def test_game_types(self):
+        self.assertSetEqual(set(GAME_TYPES), {'tictactoe', 'rockpaperscissors', 'mnk'})
+        self.assertIsNone(GAME_TYPES._entry_point_group)
+
+    def test_close(self):
+        async def play():
+            manager = SessionManager()
+            session = manager.create('tictactoe')
+            states = []
+
+            async def watch():
+                async for state in session.subscribe():
+                    states.append(state)
+
+            watcher = gather(watch())
+
+            await sleep(0)
+            await manager.act(session.id, 0, 'mark', 1, 1)
+            await sleep(0)
+            manager.close(session.id)
+            await wait_for(watcher, 1)
+
+            self.assertTrue(session.closed)
+            self.assertEqual(len(manager), 0)
+            self.assertEqual([state async for state in session.subscribe()], [])
+
+            with self.assertRaises(ValueError):
+                await session.act(1, 'mark', 0, 0)
+
+            return states
+
+        states = run(play())
+
+        self.assertEqual([state['version'] for state in states], [0, 1])
+        self.assertFalse(states[-1]['terminal'])
+
+    def test_concurrency(self):
+        async def play(manager, session):
+            while not session.game.is_terminal():
+                await manager.act(session.id, session.game.actor.index, 'mark')
+
+            return session.state
+
+        async def play_all():
+            manager = SessionManager()
+            states = await gather(*(play(manager, manager.create('mnk', 5, 5, 4)) for _ in range(1000)))
+
+            self.assertEqual(len(manager), 1000)
+
+            for state in states:
+                manager.close(state['session'])
+
+            self.assertEqual(len(manager), 0)
+
+            return states
+
+        states = run(play_all())
+
+        self.assertEqual(len({state['session'] for state in states}), 1000)
+        self.assertTrue(all(state['terminal'] for state in states))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,15 @@
+import pickle
+import random
+from copy import deepcopy
+from random import Random
 from unittest import TestCase, main
 
 from auxiliary import next_or_none
 
 from gameframe.exceptions import GameFrameError
+from gameframe.game import RandomBuffer
 from gameframe.games.tictactoe import TicTacToeGame
+from gameframe.sequential import _SequentialAction
 from gameframe.tests import GameFrameTestCaseMixin
 
 
@@ -47,6 +53,187 @@ class TicTacToeTestCase(GameFrameTestCaseMixin, TestCase):
         self.assertRaises(GameFrameError, TicTacToeGame().mark, (3, 3))
         self.assertRaises(GameFrameError, TicTacToeGame().mark, (-1, -1))
         self.assertRaises(GameFrameError, TicTacToeGame().mark((0, 0)).players[0].mark, 0, 1)
+        self.assertRaises(TypeError, TicTacToeGame().players[0].can_mark, 0.0, 1)
+        self.assertRaises(ValueError, TicTacToeGame().players[0].can_mark, 0)
+        self.assertFalse(TicTacToeGame().players[0].can_mark(3, 0))
+
+    def test_undo(self):
+        game = TicTacToeGame().mark((0, 0), (1, 0), (0, 1), (1, 1), (0, 2))
+
+        self.assertIs(game.undo().actor, game.players[0])
+        self.assertIsNone(game.winner)
+        self.assertIsNone(game.board[0][2])
+        self.assertIs(game.undo().actor, game.players[1])
+        self.assertIsNone(game.board[1][1])
+        self.assertIs(game.mark((2, 2)).board[2][2], game.players[1])
+
+        game = TicTacToeGame()
+
+        for _ in range(9):
+            if not game.is_terminal():
+                game.actor.mark()
+
+        while game._actions:
+            game.undo()
+
+        self.assertIs(game.actor, game.players[0])
+        self.assertSequenceEqual(tuple(game.empty_cell_locations), tuple((r, c) for r in range(3) for c in range(3)))
+        self.assertRaises(GameFrameError, game.undo)
+
+    def test_abstract_actions(self):
+        class Action(_SequentialAction):
+            def apply(self):
+                pass
+
+        self.assertRaises(TypeError, Action, TicTacToeGame().actor)
+
+    def test_clone(self):
+        game = TicTacToeGame().mark((1, 1), (0, 0))
+        clone = game.clone().mark((2, 2))
+
+        self.assertIs(clone.board[1][1], clone.players[0])
+        self.assertIs(clone.board[2][2], clone.players[0])
+        self.assertIs(clone.actor, clone.players[1])
+        self.assertIsNone(game.board[2][2])
+        self.assertIs(game.actor, game.players[0])
+        self.assertIs(clone.undo().undo().actor, clone.players[1])
+        self.assertIs(clone.board[0][0], None)
+        self.assertIs(game.board[0][0], game.players[1])
+
+    def test_pickle(self):
+        game = TicTacToeGame().mark((1, 1))
+
+        for copied_game in (pickle.loads(pickle.dumps(game)), deepcopy(game)):
+            boards = []
+
+            for marked_game in (copied_game, game.clone()):
+                random.seed(0)
+                marked_game.actor.mark()
+                boards.append(tuple(tuple(cell and cell.index for cell in row) for row in marked_game.board))
+
+            self.assertEqual(boards[0], boards[1])
+            self.assertIs(copied_game.actor, copied_game.players[0])
+
+    def test_reset(self):
+        game = TicTacToeGame().mark((0, 0), (1, 0), (0, 1), (1, 1), (0, 2))
+        players = game.players
+
+        self.assertIs(game.reset(), game)
+        self.assertSequenceEqual(game.players, players)
+        self.assertIs(game.actor, players[0])
+        self.assertIsNone(game.winner)
+        self.assertEqual(len(tuple(game.empty_cell_locations)), 9)
+        self.assertRaises(GameFrameError, game.undo)
+        self.assertIs(game.mark((1, 1)).board[1][1], players[0])
+
+    def test_board_view(self):
+        game = TicTacToeGame()
+        view = game.board_view
+
+        self.assertIs(game.board_view, view)
+        self.assertEqual(len(view), 3)
+
+        for _ in range(5):
+            game.actor.mark()
+
+            self.assertSequenceEqual(tuple(map(tuple, view)), game.board)
+            self.assertSequenceEqual(view[-1][1:], game.board[2][1:])
+            self.assertEqual(repr(list(view)), repr(list(game.board)))
+
+        self.assertRaises(IndexError, view.__getitem__, 3)
+        self.assertRaises(IndexError, view[0].__getitem__, 3)
+
+        clone = game.clone()
+        clone.reset()
+
+        self.assertSequenceEqual(tuple(map(tuple, clone.board_view)), ((None,) * 3,) * 3)
+        self.assertSequenceEqual(tuple(map(tuple, view)), game.board)
+
+    def test_changes(self):
+        game = TicTacToeGame().mark((1, 1))
+        players = game.players
+
+        with game.changes() as changes:
+            self.assertSequenceEqual(tuple(changes), ())
+
+            game.mark((0, 0), (2, 2))
+
+            self.assertEqual(len(changes), 2)
+            self.assertSequenceEqual(tuple(changes), (((0, 0), players[1]), ((2, 2), players[0])))
+            self.assertSequenceEqual(tuple(changes), ())
+
+            game.undo().clone().mark((0, 1))
+
+            self.assertSequenceEqual(tuple(changes), (((2, 2), None),))
+
+            game.reset()
+
+            self.assertSetEqual(set(changes), {((1, 1), None), ((0, 0), None)})
+
+        game.mark((1, 1))
+
+        self.assertSequenceEqual(tuple(changes), ())
+
+    def test_rng(self):
+        boards = []
+
+        for rng in (0, 0, Random(0), RandomBuffer(0), RandomBuffer(Random(0)), 1):
+            game = TicTacToeGame(rng)
+
+            while not game.is_terminal():
+                game.actor.mark()
+
+            boards.append(tuple(tuple(cell and cell.index for cell in row) for row in game.board))
+
+        self.assertEqual(len(set(boards[:5])), 1)
+        self.assertNotEqual(boards[0], boards[5])
+
+        game = TicTacToeGame(random)
+
+        while not game.is_terminal():
+            game.actor.mark()
+
+        self.assertIs(game._random.random, random.random)
+
+        winners = []
+
+        for _ in range(2):
+            rng = RandomBuffer(0)
+            winners.append([])
+
+            for _ in range(100):
+                game = TicTacToeGame(rng)
+
+                while not game.is_terminal():
+                    game.actor.mark()
+
+                winners[-1].append(game.winner and game.winner.index)
+
+        self.assertEqual(winners[0], winners[1])
+
+    def test_checked(self):
+        game = TicTacToeGame().mark((0, 0))
+
+        self.assertTrue(game.checked)
+        self.assertRaises(GameFrameError, game.actor.mark, 0, 0)
+        self.assertRaises(GameFrameError, game.players[0].mark, 1, 1)
+
+        game.actor.mark(1, 1, checked=False)
+        game.mark((0, 1), (2, 2), (0, 2), checked=False)
+
+        self.assertIs(game.winner, game.players[0])
+        self.assertRaises(GameFrameError, game.players[1].mark, 1, 0)
+
+        game = TicTacToeGame()
+        game.checked = False
+        game.players[1].mark(1, 1)
+
+        self.assertFalse(game.clone().checked)
+        self.assertEqual(game.board[1][1], game.players[1])
+
+        game.checked = True
+
+        self.assertRaises(GameFrameError, game.players[1].mark, 0, 0)
 
     def create_game(self):
         return TicTacToeGame()
@@ -55,6 +242,18 @@ class TicTacToeTestCase(GameFrameTestCaseMixin, TestCase):
         game.actor.mark()
 
     def verify(self, game):
+        self.assertSequenceEqual(
+            tuple(game.empty_cell_locations),
+            tuple((r, c) for r in range(3) for c in range(3) if game.board[r][c] is None),
+        )
+
+        for player in game.players:
+            self.assertSequenceEqual(
+                tuple(player.markable_cell_locations),
+                tuple((r, c) for r in range(3) for c in range(3) if player.can_mark(r, c)),
+            )
+            self.assertEqual(player.mark_mask, sum(1 << (3 * r + c) for r, c in player.markable_cell_locations))
+
         if game.is_terminal():
             self.assertTrue(next_or_none(game.empty_cell_locations) is None or game.winner is not None)
 
@@ -0,0 +1,45 @@
+from unittest import TestCase, main
+
+from gameframe.games.tictactoe import TicTacToeGame
+from gameframe.games.tictactoeperft import perft
+
+NODE_COUNTS = 1, 9, 72, 504, 3024, 15120, 54720, 148176, 200448, 127872
+
+
+class TicTacToePerftTestCase(TestCase):
+    def test_empty_board(self):
+        result = perft(TicTacToeGame(), 9, True)
+
+        self.assertSequenceEqual(result.node_counts, NODE_COUNTS)
+        self.assertEqual(result.leaf_count, 127872)
+        self.assertDictEqual(result.outcomes, {0: 131184, 1: 77904, None: 46080})
+        self.assertSequenceEqual(perft(TicTacToeGame(), 5).node_counts, NODE_COUNTS[:6])
+        self.assertSequenceEqual(perft(TicTacToeGame(), 5, process_count=2).node_counts, NODE_COUNTS[:6])
+
+    def test_positions(self):
+        game = TicTacToeGame().mark((0, 0), (1, 0), (0, 1), (1, 1))
+
+        self.assertSequenceEqual(perft(game, 0).node_counts, (1,))
+        self.assertSequenceEqual(perft(game, 2).node_counts, (1, 5, 16))
+        self.assertDictEqual(perft(game, 2).outcomes, {0: 1, 1: 3})
+        self.assertEqual(len(game._actions), 4)
+
+        game.mark((0, 2))
+
+        self.assertSequenceEqual(perft(game, 3).node_counts, (1, 0, 0, 0))
+        self.assertDictEqual(perft(game, 3).outcomes, {0: 1})
+        self.assertRaises(ValueError, perft, game, -1)
+
+    def test_consistency(self):
+        game = TicTacToeGame().mark((1, 1), (0, 2))
+
+        for depth in range(8):
+            results = perft(game, depth), perft(game, depth, True), perft(game, depth, process_count=2)
+
+            for result in results[1:]:
+                self.assertSequenceEqual(result.node_counts, results[0].node_counts)
+                self.assertDictEqual(result.outcomes, results[0].outcomes)
+
+
+if __name__ == '__main__':
+    main()
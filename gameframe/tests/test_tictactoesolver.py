@@ -0,0 +1,58 @@
+from random import randint
+from unittest import TestCase, main
+
+from gameframe.games.tictactoe import TicTacToeGame
+from gameframe.games.tictactoesolver import TicTacToeSolver
+
+
+class TicTacToeSolverTestCase(TestCase):
+    def test_empty_board(self):
+        solver = TicTacToeSolver()
+
+        self.assertEqual(solver.value(TicTacToeGame()), 0)
+        self.assertEqual(len(solver), 765)
+        self.assertEqual(len(solver.best_moves(TicTacToeGame())), 9)
+
+    def test_positions(self):
+        solver = TicTacToeSolver()
+
+        self.assertEqual(solver.value(TicTacToeGame().mark((1, 1), (0, 1))), 1)
+        self.assertEqual(solver.value(TicTacToeGame().mark((1, 1), (0, 0))), 0)
+        self.assertEqual(solver.value(TicTacToeGame().mark((0, 0), (1, 0), (0, 1), (1, 1), (2, 2), (1, 2))), -1)
+        self.assertSequenceEqual(
+            solver.best_moves(TicTacToeGame().mark((0, 0), (1, 1), (2, 2))),
+            ((0, 1), (1, 0), (1, 2), (2, 1)),
+        )
+        self.assertSequenceEqual(solver.best_moves(TicTacToeGame().mark((0, 0), (1, 0), (0, 1), (1, 1))), ((0, 2),))
+        self.assertSequenceEqual(solver.best_moves(TicTacToeGame().mark((0, 0), (1, 1), (0, 1), (2, 2), (0, 2))), ())
+
+    def test_brute_force(self):
+        solver = TicTacToeSolver()
+
+        for _ in range(100):
+            game = TicTacToeGame()
+
+            for _ in range(randint(3, 9)):
+                if not game.is_terminal():
+                    game.actor.mark()
+
+            self.assertEqual(solver.value(game), self._brute_force(game))
+
+            for r, c in solver.best_moves(game):
+                self.assertEqual(solver.value(game), self._brute_force(game.clone().mark((r, c))))
+
+    def _brute_force(self, game):
+        if game.is_terminal():
+            return 0 if game.winner is None else 1 if game.winner is game.players[0] else -1
+
+        values = []
+
+        for r, c in tuple(game.empty_cell_locations):
+            values.append(self._brute_force(game.mark((r, c))))
+            game.undo()
+
+        return max(values) if game.actor is game.players[0] else min(values)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, main
+
+from gameframe.exceptions import GameFrameError
+from gameframe.games.tictactoe import TicTacToeGame
+from gameframe.games.tictactoesolver import TicTacToeSolver
+from gameframe.games.tictactoetable import PATH, TicTacToeTable, generate_table, get_index
+
+
+class TicTacToeTableTestCase(TestCase):
+    def test_file(self):
+        with open(PATH, 'rb') as file:
+            self.assertEqual(file.read(), generate_table())
+
+        with TemporaryDirectory() as directory:
+            with open(path.join(directory, 'table.bin'), 'wb') as file:
+                file.write(bytes(10))
+
+            self.assertRaises(ValueError, TicTacToeTable, path.join(directory, 'table.bin'))
+
+    def test_lookups(self):
+        self.assertEqual(get_index(TicTacToeGame()), 0)
+        self.assertEqual(get_index(TicTacToeGame().mark((0, 0), (2, 2))), 1 + 2 * 3 ** 8)
+
+        solver = TicTacToeSolver()
+
+        with TicTacToeTable() as table:
+            self.assertEqual(len(table), 3 ** 9)
+
+            for _ in range(200):
+                game = TicTacToeGame()
+
+                while True:
+                    self.assertIs(table.winner(game), game.winner)
+                    self.assertEqual(table.is_terminal(game), game.is_terminal())
+                    self.assertEqual(table.value(game), solver.value(game))
+
+                    if game.is_terminal():
+                        self.assertIsNone(table.best_move(game))
+                        self.assertRaises(GameFrameError, table.mark, game)
+
+                        break
+
+                    self.assertIn(table.best_move(game), solver.best_moves(game))
+
+                    game.actor.mark()
+
+    def test_optimal_play(self):
+        with TicTacToeTable() as table:
+            game = TicTacToeGame()
+
+            while not game.is_terminal():
+                table.mark(game)
+
+            self.assertIsNone(game.winner)
+
+            for r, c in TicTacToeGame().empty_cell_locations:
+                game = TicTacToeGame().mark((r, c))
+
+                while not game.is_terminal():
+                    if game.actor.index == 1:
+                        table.mark(game)
+                    else:
+                        game.actor.mark()
+
+                self.assertIsNot(game.winner, game.players[0])
+
+
+if __name__ == '__main__':
+    main()
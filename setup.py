@@ -13,6 +13,7 @@ setup(
     long_description_content_type='text/x-rst',
     url='https://github.com/AussieSeaweed/gameframe',
     packages=find_packages(),
+    package_data={'gameframe.games': ['tictactoetable.bin']},
     classifiers=(
         'License :: OSI Approved :: GNU General Public License v3 (GPLv3)',
         'Operating System :: OS Independent',
@@ -26,4 +27,5 @@ setup(
     ),
     python_requires='>=3.7',
     install_requires='auxiliary',
+    extras_require={'numpy': 'numpy'},
 )